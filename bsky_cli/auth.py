@@ -4,12 +4,18 @@ from __future__ import annotations
 import datetime as dt
 import os
 import subprocess
+import time
 
 from .http import requests
 
 PASS_PATH = "api/bsky-echo"
 OPENROUTER_PASS_PATH = "api/openrouter-bsky"
 
+# Access JWTs are short-lived, so a session is only reused for a while.
+SESSION_TTL_SECONDS = 30 * 60
+
+_session_cache: tuple[float, tuple[str, str, str, str]] | None = None
+
 
 def get_openrouter_pass_path() -> str:
     """Return pass path for OpenRouter key used by BlueSky features."""
@@ -61,7 +67,15 @@ def create_session(pds: str, identifier: str, password: str) -> dict:
 
 
 def get_session() -> tuple[str, str, str, str]:
-    """Get authenticated session. Returns (pds, did, access_jwt, handle)."""
+    """Get authenticated session. Returns (pds, did, access_jwt, handle).
+
+    The session is cached for SESSION_TTL_SECONDS so commands that call this
+    repeatedly do not re-read pass and log in again each time.
+    """
+    global _session_cache
+    if _session_cache is not None and time.monotonic() - _session_cache[0] < SESSION_TTL_SECONDS:
+        return _session_cache[1]
+
     env = load_credentials()
     login_pds = env.get("BSKY_PDS", "https://bsky.social")
     handle = env.get("BSKY_HANDLE")
@@ -84,7 +98,15 @@ def get_session() -> tuple[str, str, str, str]:
     
     # Use the server-returned handle when available (even if we logged in via email)
     actual_handle = sess.get("handle") or handle or email
-    return pds, sess["did"], sess["accessJwt"], actual_handle
+    session = (pds, sess["did"], sess["accessJwt"], actual_handle)
+    _session_cache = (time.monotonic(), session)
+    return session
+
+
+def clear_session_cache() -> None:
+    """Forget the cached session so the next get_session() logs in again."""
+    global _session_cache
+    _session_cache = None
 
 
 def utc_now_iso() -> str:
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
 from collections import defaultdict
 
 from .auth import get_session, resolve_handle
@@ -300,6 +301,8 @@ def run(args) -> int:
 
     # Open per-account DB and ensure schema
     conn = open_db(account_handle)
+    # Rows are read by column name below; don't rely on the opener's config.
+    conn.row_factory = sqlite3.Row
     ensure_schema(conn)
 
     # Seed from legacy JSON (best-effort). We do it lazily if DB looks empty.
@@ -88,6 +88,11 @@ def get_config(state: dict) -> dict:
 # API HELPERS
 # ============================================================================
 
+def _cursor_advanced(prev: str | None, nxt: str | None, seen: set[str] | frozenset[str] = frozenset()) -> bool:
+    """True if *nxt* is a usable new pagination cursor (not empty, repeated or seen)."""
+    return bool(nxt) and nxt != prev and nxt not in seen
+
+
 def get_follows(
     pds: str,
     jwt: str,
@@ -137,9 +142,7 @@ def get_follows(
                 break
 
             next_cursor = data.get("cursor")
-            if not next_cursor:
-                break
-            if next_cursor == cursor or next_cursor in seen_cursors:
+            if not _cursor_advanced(cursor, next_cursor, seen_cursors):
                 break
 
             seen_cursors.add(next_cursor)
@@ -8,7 +8,9 @@ import random
 import subprocess
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import InitVar, dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable
 
@@ -78,7 +80,7 @@ class RunProfiler:
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Represents a BlueSky post with metadata."""
     uri: str
@@ -98,19 +100,53 @@ class Post:
     
     # Scoring
     base_score: float = 1.0
-    multipliers: dict = field(default_factory=dict)
+    # Parallel name/value lists: posts only carry a handful of multipliers
+    _mult_names: list[str] = field(default_factory=list, init=False, repr=False)
+    _mult_values: list[float] = field(default_factory=list, init=False, repr=False)
+    
+    # Parsed created_at and the string it was parsed from, so reassigning
+    # created_at is picked up on the next read
+    _created_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _created_dt: dt.datetime | None = field(default=None, init=False, repr=False, compare=False)
+    # created_at already parsed by the caller, saves parsing it again
+    created_parsed: InitVar[dt.datetime | None] = None
+    
+    def __post_init__(self, created_parsed: dt.datetime | None):
+        if created_parsed is not None:
+            self._created_src, self._created_dt = self.created_at, created_parsed
+    
+    @property
+    def created_dt(self) -> dt.datetime | None:
+        """created_at as a datetime, or None if it can't be parsed."""
+        if self._created_src != self.created_at:
+            self._created_src, self._created_dt = self.created_at, None
+            if self.created_at:
+                try:
+                    self._created_dt = dt.datetime.fromisoformat(self.created_at)
+                except ValueError:
+                    pass
+        return self._created_dt
     
     @property
     def final_score(self) -> float:
         """Calculate final score with all multipliers."""
         score = self.base_score
-        for name, mult in self.multipliers.items():
+        for mult in self._mult_values:
             score *= mult
         return score
     
+    @property
+    def multipliers(self) -> dict[str, float]:
+        """Applied multipliers by name."""
+        return dict(zip(self._mult_names, self._mult_values))
+    
     def add_multiplier(self, name: str, value: float):
-        """Add a scoring multiplier."""
-        self.multipliers[name] = value
+        """Add a scoring multiplier (replaces one with the same name)."""
+        try:
+            self._mult_values[self._mult_names.index(name)] = value
+        except ValueError:
+            self._mult_names.append(name)
+            self._mult_values.append(value)
 
 
 # ============================================================================
@@ -119,6 +155,7 @@ class Post:
 
 class PostFilter(ABC):
     """Base class for post filters. Subclass to add new filters."""
+    __slots__ = ()
     
     @property
     @abstractmethod
@@ -134,28 +171,34 @@ class PostFilter(ABC):
 
 class AlreadyRepliedFilter(PostFilter):
     """Exclude posts we've already replied to."""
+    __slots__ = ()
     name = "already_replied"
     
     def should_include(self, post: Post, state: dict) -> bool:
-        replied_uris = set(state.get("replied_posts", []))
+        replied_uris = state.get("_replied_set")
+        if replied_uris is None:
+            replied_uris = set(state.get("replied_posts", []))
         return post.uri not in replied_uris
 
 
 class AccountLimitFilter(PostFilter):
     """Limit replies per account per session."""
+    __slots__ = ("max_per_session",)
     name = "account_limit"
     
     def __init__(self, max_per_session: int = 1):
         self.max_per_session = max_per_session
     
     def should_include(self, post: Post, state: dict) -> bool:
-        replied_accounts = state.get("replied_accounts_today", [])
-        count = replied_accounts.count(post.author_did)
-        return count < self.max_per_session
+        counts = state.get("_account_counter")
+        if counts is None:
+            counts = Counter(state.get("replied_accounts_today", []))
+        return counts[post.author_did] < self.max_per_session
 
 
 class MinTextLengthFilter(PostFilter):
     """Exclude very short posts."""
+    __slots__ = ("min_chars",)
     name = "min_length"
     
     def __init__(self, min_chars: int = 20):
@@ -167,6 +210,7 @@ class MinTextLengthFilter(PostFilter):
 
 class EngagementFilter(PostFilter):
     """Filter by engagement levels (replies, likes, reposts)."""
+    __slots__ = ("min_likes", "max_likes", "min_replies", "max_replies")
     name = "engagement"
     
     def __init__(self, min_likes: int = 0, max_likes: int | None = None,
@@ -192,6 +236,7 @@ class EngagementFilter(PostFilter):
 
 class ConversationFilter(PostFilter):
     """Filter for conversation continuation (replies to our posts)."""
+    __slots__ = ("our_did",)
     name = "conversation"
     
     def __init__(self, our_did: str):
@@ -209,6 +254,7 @@ class ConversationFilter(PostFilter):
 
 class ScoreMultiplier(ABC):
     """Base class for score multipliers."""
+    __slots__ = ()
     
     @property
     @abstractmethod
@@ -223,6 +269,7 @@ class ScoreMultiplier(ABC):
 
 class LowEngagementBonus(ScoreMultiplier):
     """Boost posts with low engagement (our reply matters more)."""
+    __slots__ = ()
     name = "low_engagement_bonus"
     
     def calculate(self, post: Post, state: dict) -> float:
@@ -237,6 +284,7 @@ class LowEngagementBonus(ScoreMultiplier):
 
 class ConversationBonus(ScoreMultiplier):
     """Boost posts that are part of ongoing conversations."""
+    __slots__ = ("our_did",)
     name = "conversation_bonus"
     
     def __init__(self, our_did: str):
@@ -252,6 +300,7 @@ class ConversationBonus(ScoreMultiplier):
 
 class FriendlyInterlocutorBonus(ScoreMultiplier):
     """Boost posts from interlocutors based on relationship level."""
+    __slots__ = ()
     name = "friendly_bonus"
     
     def calculate(self, post: Post, state: dict) -> float:
@@ -278,12 +327,16 @@ class FriendlyInterlocutorBonus(ScoreMultiplier):
 
 class FreshPostBonus(ScoreMultiplier):
     """Boost very recent posts (reply while relevant)."""
+    __slots__ = ()
     name = "fresh_post_bonus"
     
     def calculate(self, post: Post, state: dict) -> float:
+        created = post.created_dt
+        if created is None:
+            return 1.0
         try:
-            created = dt.datetime.fromisoformat(post.created_at.replace("Z", "+00:00"))
-            age_hours = (dt.datetime.now(dt.timezone.utc) - created).total_seconds() / 3600
+            now = state.get("_now") or dt.datetime.now(dt.timezone.utc)
+            age_hours = (now - created).total_seconds() / 3600
             if age_hours < 1:
                 return 1.3
             elif age_hours < 3:
@@ -314,28 +367,26 @@ class FilterPipeline:
     
     def process(self, posts: list[Post], state: dict) -> list[Post]:
         """Apply filters and multipliers, return sorted candidates."""
-        candidates = []
+        # Index the persisted lists once per run; copy so the saved state stays JSON-only
+        state = {
+            **state,
+            "_now": dt.datetime.now(dt.timezone.utc),
+            "_replied_set": frozenset(state.get("replied_posts", ())),
+            "_account_counter": Counter(state.get("replied_accounts_today", ())),
+        }
         
-        for post in posts:
-            # Apply all filters
-            passed = True
-            for f in self.filters:
-                if not f.should_include(post, state):
-                    passed = False
-                    break
-            
-            if not passed:
-                continue
-            
-            # Apply all multipliers
-            for m in self.multipliers:
-                mult = m.calculate(post, state)
-                post.add_multiplier(m.name, mult)
-            
-            candidates.append(post)
+        # Bind methods once per run; all() over a generator stops at the first reject
+        checks = [f.should_include for f in self.filters]
+        candidates = [p for p in posts if all(check(p, state) for check in checks)]
+        
+        # Apply all multipliers
+        scorers = [(m.name, m.calculate) for m in self.multipliers]
+        for post in candidates:
+            for name, calculate in scorers:
+                post.add_multiplier(name, calculate(post, state))
         
         # Sort by final score (descending)
-        candidates.sort(key=lambda p: p.final_score, reverse=True)
+        candidates.sort(key=attrgetter("final_score"), reverse=True)
         return candidates
 
 
@@ -497,48 +548,57 @@ def get_author_feed(pds: str, jwt: str, actor: str, limit: int = 10) -> list[dic
         return []
 
 
+def _recent_post(item: dict, cutoff: dt.datetime, cutoff_prefix: str) -> Post | None:
+    """Convert one feed item to a Post, or None if it is older than cutoff."""
+    post_data = item.get("post", {})
+    record = post_data.get("record", {})
+    created = record.get("createdAt", "")
+    
+    if not created:
+        return None
+    if created.endswith("Z") and created[10:11] == "T" and created[:19] < cutoff_prefix:
+        return None
+    
+    try:
+        ts = dt.datetime.fromisoformat(created)
+        if ts <= cutoff:
+            return None
+    except Exception:
+        return None
+    
+    # Check if it's a reply
+    reply_ref = record.get("reply") or {}
+    parent = reply_ref.get("parent") or {}
+    root = reply_ref.get("root") or {}
+    author = post_data.get("author", {})
+    
+    post = Post(
+        uri=post_data.get("uri", ""),
+        cid=post_data.get("cid", ""),
+        author_did=author.get("did", ""),
+        author_handle=author.get("handle", ""),
+        text=record.get("text", "")[:500],
+        created_at=created,
+        created_parsed=ts,  # already parsed for the cutoff check
+        reply_count=post_data.get("replyCount", 0),
+        like_count=post_data.get("likeCount", 0),
+        repost_count=post_data.get("repostCount", 0),
+        is_reply=bool(reply_ref),
+        parent_uri=parent.get("uri"),
+        parent_cid=parent.get("cid"),
+        root_uri=root.get("uri"),
+        root_cid=root.get("cid"),
+    )
+    return post
+
+
 def filter_recent_posts(posts: list[dict], hours: int = 12) -> list[Post]:
     """Filter posts from the last N hours and convert to Post objects."""
     cutoff = dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=hours)
-    recent = []
-    
-    for item in posts:
-        post_data = item.get("post", {})
-        record = post_data.get("record", {})
-        created = record.get("createdAt", "")
-        
-        if not created:
-            continue
-        
-        try:
-            ts = dt.datetime.fromisoformat(created.replace("Z", "+00:00"))
-            if ts <= cutoff:
-                continue
-        except Exception:
-            continue
-        
-        # Check if it's a reply
-        reply_ref = record.get("reply", {})
-        is_reply = bool(reply_ref)
-        
-        recent.append(Post(
-            uri=post_data.get("uri", ""),
-            cid=post_data.get("cid", ""),
-            author_did=post_data.get("author", {}).get("did", ""),
-            author_handle=post_data.get("author", {}).get("handle", ""),
-            text=record.get("text", "")[:500],
-            created_at=created,
-            reply_count=post_data.get("replyCount", 0),
-            like_count=post_data.get("likeCount", 0),
-            repost_count=post_data.get("repostCount", 0),
-            is_reply=is_reply,
-            parent_uri=reply_ref.get("parent", {}).get("uri") if is_reply else None,
-            parent_cid=reply_ref.get("parent", {}).get("cid") if is_reply else None,
-            root_uri=reply_ref.get("root", {}).get("uri") if is_reply else None,
-            root_cid=reply_ref.get("root", {}).get("cid") if is_reply else None
-        ))
-    
-    return recent
+    # Canonical UTC timestamps sort as strings: reject older seconds without parsing
+    cutoff_prefix = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
+    converted = (_recent_post(item, cutoff, cutoff_prefix) for item in posts)
+    return [post for post in converted if post is not None]
 
 
 def select_posts_with_llm(candidates: list[Post], state: dict, dry_run: bool = False) -> list[dict]:
@@ -690,7 +750,7 @@ def post_reply(
         
     If root is not provided, parent is used as root (for top-level replies).
     """
-    now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     
     # Use parent as root if root not specified (replying to a non-reply post)
     actual_root_uri = root_uri or parent_uri
@@ -738,9 +798,9 @@ def create_default_pipeline(our_did: str) -> FilterPipeline:
     cfg = get_engage_config()
     return (FilterPipeline()
         # Filters (order matters - fastest/most selective first)
+        .add_filter(MinTextLengthFilter(min_chars=cfg.get("min_text_length", 20)))
         .add_filter(AlreadyRepliedFilter())
         .add_filter(AccountLimitFilter(max_per_session=cfg.get("max_per_account", 1)))
-        .add_filter(MinTextLengthFilter(min_chars=cfg.get("min_text_length", 20)))
         .add_filter(EngagementFilter(max_replies=cfg.get("max_thread_replies", 50)))
         # Multipliers
         .add_multiplier(LowEngagementBonus())
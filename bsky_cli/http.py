@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import requests as _requests
 
 from .config import get
@@ -9,16 +11,33 @@ from .ratelimit import RateLimiter
 
 
 _limiter: RateLimiter | None = None
+# One Session shared by every thread (e.g. post's parallel handle lookups) by
+# design: its urllib3 connection pool is thread-safe and keeps hosts warm.
+_session: _requests.Session | None = None
+# Guards lazy creation so concurrent first calls cannot build two singletons
+_init_lock = threading.Lock()
 
 
 def get_limiter() -> RateLimiter:
     global _limiter
     if _limiter is None:
-        calls_per_minute = get("api.calls_per_minute", 60)
-        _limiter = RateLimiter(calls_per_minute=calls_per_minute)
+        with _init_lock:
+            if _limiter is None:
+                calls_per_minute = get("api.calls_per_minute", 60)
+                _limiter = RateLimiter(calls_per_minute=calls_per_minute)
     return _limiter
 
 
+def get_http_session() -> _requests.Session:
+    """Shared session so consecutive calls to the same host reuse connections."""
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                _session = _requests.Session()
+    return _session
+
+
 class _RateLimitedRequests:
     """Drop-in subset of requests module with rate limiting."""
 
@@ -31,12 +50,12 @@ class _RateLimitedRequests:
     @staticmethod
     def get(url: str, **kwargs):
         get_limiter().wait_if_needed()
-        return _requests.get(url, **kwargs)
+        return get_http_session().get(url, **kwargs)
 
     @staticmethod
     def post(url: str, **kwargs):
         get_limiter().wait_if_needed()
-        return _requests.post(url, **kwargs)
+        return get_http_session().post(url, **kwargs)
 
 
 requests = _RateLimitedRequests()
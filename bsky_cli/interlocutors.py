@@ -8,8 +8,10 @@ Maintains a persistent record of who we've interacted with, enabling:
 from __future__ import annotations
 
 import json
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Literal
 
@@ -43,6 +45,9 @@ REGULAR_THRESHOLD = 3  # Use get_friendly_threshold() instead
 # Maximum interactions to store per user (keep recent ones)
 MAX_INTERACTIONS_PER_USER = 50
 
+# Stored our_text/their_text are cut to this many characters
+MAX_INTERACTION_TEXT = 200
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -61,7 +66,7 @@ InteractionType = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """A single interaction with a user."""
     date: str
@@ -84,7 +89,7 @@ class Interaction:
         return cls(**d)
 
 
-@dataclass
+@dataclass(slots=True)
 class Interlocutor:
     """A user we've interacted with."""
     did: str
@@ -93,10 +98,15 @@ class Interlocutor:
     first_seen: str = ""
     last_interaction: str = ""
     total_count: int = 0
-    interactions: list[Interaction] = field(default_factory=list)
+    interactions: deque[Interaction] = field(default_factory=lambda: deque(maxlen=MAX_INTERACTIONS_PER_USER))
     notes: str = ""  # Manual notes about this person
     tags: list[str] = field(default_factory=list)  # e.g., ["friendly", "technical", "ai-researcher"]
     
+    def __post_init__(self):
+        # Bounded history: appends past the limit drop the oldest entry
+        if not isinstance(self.interactions, deque) or self.interactions.maxlen != MAX_INTERACTIONS_PER_USER:
+            self.interactions = deque(self.interactions, maxlen=MAX_INTERACTIONS_PER_USER)
+    
     @property
     def is_friendly(self) -> bool:
         """Is this a friendly interlocutor (3+ interactions by default)?"""
@@ -122,20 +132,18 @@ class Interlocutor:
             return f"{self.total_count} interactions (since {self.first_seen})"
     
     def add_interaction(self, interaction: Interaction):
-        """Add an interaction, maintaining limits."""
+        """Add an interaction (history keeps the last MAX_INTERACTIONS_PER_USER)."""
         self.interactions.append(interaction)
         self.total_count += 1
         self.last_interaction = interaction.date
         if not self.first_seen:
             self.first_seen = interaction.date
-        
-        # Trim old interactions if over limit
-        if len(self.interactions) > MAX_INTERACTIONS_PER_USER:
-            self.interactions = self.interactions[-MAX_INTERACTIONS_PER_USER:]
     
     def recent_interactions(self, n: int = 5) -> list[Interaction]:
-        """Get N most recent interactions."""
-        return self.interactions[-n:]
+        """Get N most recent interactions (same as interactions[-n:])."""
+        if n <= 0:
+            return list(self.interactions)[-n:]
+        return list(islice(self.interactions, max(0, len(self.interactions) - n), None))
     
     def to_dict(self) -> dict:
         return {
@@ -147,7 +155,7 @@ class Interlocutor:
             "total_count": self.total_count,
             "interactions": [i.to_dict() for i in self.interactions],
             "notes": self.notes,
-            "tags": self.tags,
+            "tags": list(self.tags),
         }
     
     @classmethod
@@ -162,7 +170,7 @@ class Interlocutor:
             total_count=d.get("total_count", 0),
             interactions=interactions,
             notes=d.get("notes", ""),
-            tags=d.get("tags", []),
+            tags=list(d.get("tags", [])),
         )
 
 
@@ -170,22 +178,74 @@ class Interlocutor:
 # STORAGE
 # ============================================================================
 
-def _load_data() -> dict[str, Interlocutor]:
-    """Load interlocutors from disk."""
-    if not INTERLOCUTORS_FILE.exists():
-        return {}
+# Parsed JSON of the store, reused while the file is unchanged (keyed on
+# path + mtime + size). Callers always get fresh Interlocutor objects built
+# from it, so in-place edits never leak into the cache unsaved.
+_cache: dict[str, dict] | None = None
+_cache_key: tuple | None = None
+
+# Casefolded handle -> DID for get_by_handle, rebuilt when the store changes
+_handle_index: dict[str, str] = {}
+_handle_index_src: dict | None = None
+
+
+def _file_key() -> tuple | None:
     try:
-        raw = json.loads(INTERLOCUTORS_FILE.read_text())
-        return {did: Interlocutor.from_dict(data) for did, data in raw.items()}
-    except Exception:
-        return {}
+        st = INTERLOCUTORS_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (INTERLOCUTORS_FILE, st.st_mtime_ns, st.st_size)
 
 
-def _save_data(data: dict[str, Interlocutor]):
-    """Save interlocutors to disk."""
+def _load_raw() -> dict[str, dict]:
+    """Parsed JSON store (DID -> dict), cached until the file changes.
+
+    The result is shared; callers must not mutate it.
+    """
+    global _cache, _cache_key
+    key = _file_key()
+    if _cache is None or key != _cache_key:
+        # Missing or unreadable files read as empty and drop what we had
+        _cache = _cache_key = None
+        _invalidate_handle_index()
+        if key is None:
+            return {}
+        try:
+            raw = json.loads(INTERLOCUTORS_FILE.read_text())
+            # Reject a store that would not load as a whole
+            for d in raw.values():
+                Interlocutor.from_dict(d)
+        except Exception:
+            return {}
+        _cache, _cache_key = raw, key
+    return _cache
+
+
+def _write_raw(raw: dict[str, dict]):
+    """Write the JSON store, caching it once it reached disk."""
+    global _cache, _cache_key
     INTERLOCUTORS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    raw = {did: inter.to_dict() for did, inter in data.items()}
+    # Only cache what actually reached disk
+    _cache = _cache_key = None
     INTERLOCUTORS_FILE.write_text(json.dumps(raw, indent=2))
+    _cache, _cache_key = raw, _file_key()
+
+
+def _load_data() -> dict[str, Interlocutor]:
+    """Load interlocutors from disk (cached until the file changes)."""
+    return {did: Interlocutor.from_dict(d) for did, d in _load_raw().items()}
+
+
+def _save_data(data: dict[str, Interlocutor]):
+    """Save interlocutors to disk."""
+    _invalidate_handle_index()  # handles may have changed
+    _write_raw({did: inter.to_dict() for did, inter in data.items()})
+
+
+def _invalidate_handle_index() -> None:
+    """Force get_by_handle to rebuild its index on the next lookup."""
+    global _handle_index_src
+    _handle_index_src = None
 
 
 # ============================================================================
@@ -231,8 +291,8 @@ def record_interaction(
         date=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
         type=interaction_type,
         post_uri=post_uri,
-        our_text=our_text[:200] if our_text else None,
-        their_text=their_text[:200] if their_text else None,
+        our_text=our_text[:MAX_INTERACTION_TEXT] if our_text else None,
+        their_text=their_text[:MAX_INTERACTION_TEXT] if their_text else None,
     )
     
     interlocutor.add_interaction(interaction)
@@ -243,18 +303,23 @@ def record_interaction(
 
 def get_interlocutor(did: str) -> Interlocutor | None:
     """Get an interlocutor by DID."""
-    data = _load_data()
-    return data.get(did)
+    d = _load_raw().get(did)
+    return Interlocutor.from_dict(d) if d is not None else None
 
 
 def get_by_handle(handle: str) -> Interlocutor | None:
-    """Get an interlocutor by handle (slower, searches all)."""
-    handle = handle.lower().lstrip("@")
-    data = _load_data()
-    for inter in data.values():
-        if inter.handle.lower() == handle:
-            return inter
-    return None
+    """Get an interlocutor by handle (case-insensitive, leading @ ignored)."""
+    global _handle_index, _handle_index_src
+    handle = handle.removeprefix("@").casefold()
+    raw = _load_raw()
+    # The index follows the JSON it was built from
+    if _handle_index_src is not raw:
+        index: dict[str, str] = {}
+        for did, d in raw.items():
+            index.setdefault(d["handle"].casefold(), did)
+        _handle_index, _handle_index_src = index, raw
+    d = raw.get(_handle_index.get(handle))
+    return Interlocutor.from_dict(d) if d is not None else None
 
 
 def is_regular(did: str) -> bool:
@@ -6,6 +6,9 @@ from datetime import datetime, timezone
 
 from .auth import get_session
 
+# https://bsky.app/profile/<handle-or-did>/post/<rkey>
+_POST_URL_RE = re.compile(r'https://bsky\.app/profile/([^/]+)/post/([^/]+)')
+
 
 def resolve_post(pds: str, jwt: str, url: str) -> tuple[str, str] | None:
     """Resolve a post URL to its URI and CID.
@@ -17,7 +20,7 @@ def resolve_post(pds: str, jwt: str, url: str) -> tuple[str, str] | None:
         Tuple of (uri, cid) or None if not found
     """
     # Parse URL: https://bsky.app/profile/handle.bsky.social/post/abc123
-    match = re.match(r'https://bsky\.app/profile/([^/]+)/post/([^/]+)', url)
+    match = _POST_URL_RE.match(url)
     if not match:
         print(f"Invalid post URL: {url}")
         return None
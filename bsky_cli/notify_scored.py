@@ -6,6 +6,7 @@ import json
 import re
 import sqlite3
 import subprocess
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -52,24 +53,28 @@ def _maybe(prob: float) -> bool:
         return False
 
 
+# Follow chance steps: <=10 interactions -> 0.0, 11-50 -> 0.1, >50 -> 0.3
+_RELATIONSHIP_FOLLOW_STEPS = (10, 50)
+_RELATIONSHIP_FOLLOW_PROBS = (0.0, 0.1, 0.3)
+
+
 def _relationship_follow_probability(total_interactions: int) -> float:
     """Return probabilistic follow chance based on interaction depth."""
     n = int(total_interactions or 0)
-    if n > 50:
-        return 0.3
-    if n > 10:
-        return 0.1
-    return 0.0
+    return _RELATIONSHIP_FOLLOW_PROBS[bisect_left(_RELATIONSHIP_FOLLOW_STEPS, n)]
+
+
+# Substring markers (e.g. "antagon" covers antagonistic/antagonism), matched in one pass
+_NEGATIVE_TONE_MARKERS = (
+    "negative", "hostile", "antagon", "toxic", "conflict", "aggressive", "blocked", "avoid",
+)
+_NEGATIVE_TONE_RE = re.compile("|".join(_NEGATIVE_TONE_MARKERS), re.IGNORECASE)
 
 
 def _is_negative_tone(tone: str | None) -> bool:
-    t = (tone or "").strip().lower()
-    if not t:
+    if not tone:
         return False
-    negative_markers = [
-        "negative", "hostile", "antagon", "toxic", "conflict", "aggressive", "blocked", "avoid",
-    ]
-    return any(m in t for m in negative_markers)
+    return _NEGATIVE_TONE_RE.search(tone) is not None
 
 
 def _load_relationship_tones() -> dict[str, str]:
@@ -2,14 +2,33 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from html.parser import HTMLParser
+from itertools import accumulate
 
 from .http import requests
 
 from .auth import get_session, utc_now_iso, upload_blob
 from .followup_notifications import schedule_notification_followups
 
+# Richtext facet patterns (see detect_facets)
+_URL_RE = re.compile(r'https?://[^\s<>\[\]()"\'\u200b]+')
+_HASHTAG_RE = re.compile(r'(?:^|\s)(#[^\d\s]\S{0,63})')
+# Conservative regex for handles (e.g. @alice.bsky.social)
+_MENTION_RE = re.compile(r'(?:^|\s)(@([A-Za-z0-9][A-Za-z0-9._-]{0,62}(?:\.[A-Za-z0-9][A-Za-z0-9._-]{0,62})+))')
+# Prose punctuation trimmed from the end of a matched URL/hashtag or handle
+_TRAILING_PUNCT = ".,;:!?)"
+_HANDLE_TRAILING_PUNCT = ".,;:!?)\"]}"
+
+_POST_URL_RE = re.compile(r"https://bsky\.app/profile/([^/]+)/post/([^/]+)")
+_AT_POST_URI_RE = re.compile(r"^at://([^/]+)/app\.bsky\.feed\.post/([^/]+)$")
+
+# (pds, handle) -> DID resolved in this process (mentions, post URLs)
+_HANDLE_DIDS: dict[tuple[str, str], str] = {}
+# Upper bound on parallel resolveHandle calls for one post's mentions
+_MAX_RESOLVE_WORKERS = 8
+
 
 class OGParser(HTMLParser):
     """Parse Open Graph meta tags from HTML."""
@@ -36,6 +55,25 @@ class OGParser(HTMLParser):
             self._in_title = False
 
 
+def _resolve_handles(pds: str, handles: set[str], resolve) -> dict[tuple[str, str], str]:
+    """Resolve distinct handles to DIDs, concurrently when there are several.
+
+    Failed lookups are left out of the result.
+    """
+    def _one(handle: str) -> tuple[str, str | None]:
+        try:
+            return handle, resolve(pds, handle)
+        except Exception:
+            return handle, None
+
+    if len(handles) == 1:
+        results = list(map(_one, handles))
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(handles), _MAX_RESOLVE_WORKERS)) as pool:
+            results = list(pool.map(_one, handles))
+    return {(pds, handle): did for handle, did in results if did is not None}
+
+
 def detect_facets(text: str, *, pds: str | None = None) -> list[dict] | None:
     """Detect richtext facets (URLs, hashtags, and best-effort @mentions).
 
@@ -43,53 +81,60 @@ def detect_facets(text: str, *, pds: str | None = None) -> list[dict] | None:
     - URLs and hashtags are detected purely locally.
     - Mentions require handle→DID resolution, so they are only attempted when `pds` is provided.
     """
+    # Every facet needs one of these sigils; plain text skips the regex passes.
+    if "://" not in text and "#" not in text and "@" not in text:
+        return None
+
     facets = []
-    
+
+    # UTF-8 byte offset of every char index, built once per text (ASCII maps 1:1).
+    byte_offsets = None if text.isascii() else list(accumulate(map(len, map(str.encode, text)), initial=0))
+
     def char_to_byte(char_idx: int) -> int:
-        return len(text[:char_idx].encode('utf-8'))
+        return char_idx if byte_offsets is None else byte_offsets[char_idx]
     
     # URLs
-    for match in re.finditer(r'https?://[^\s<>\[\]()"\'\u200b]+', text):
-        url = match.group(0).rstrip('.,;:!?)')
+    for match in _URL_RE.finditer(text):
+        url = match.group(0).rstrip(_TRAILING_PUNCT)
         byte_start = char_to_byte(match.start())
-        byte_end = byte_start + len(url.encode('utf-8'))
+        byte_end = char_to_byte(match.start() + len(url))
         facets.append({
             "index": {"byteStart": byte_start, "byteEnd": byte_end},
             "features": [{"$type": "app.bsky.richtext.facet#link", "uri": url}]
         })
     
     # Hashtags
-    for match in re.finditer(r'(?:^|\s)(#[^\d\s]\S{0,63})', text):
-        tag = match.group(1).rstrip('.,;:!?)')
+    for match in _HASHTAG_RE.finditer(text):
+        tag = match.group(1).rstrip(_TRAILING_PUNCT)
         byte_start = char_to_byte(match.start(1))
-        byte_end = byte_start + len(tag.encode('utf-8'))
+        byte_end = char_to_byte(match.start(1) + len(tag))
         facets.append({
             "index": {"byteStart": byte_start, "byteEnd": byte_end},
             "features": [{"$type": "app.bsky.richtext.facet#tag", "tag": tag[1:]}]
         })
 
     # Mentions (best-effort): only if we have a PDS for resolveHandle.
-    if pds:
+    if pds and "@" in text:
         try:
             from .auth import resolve_handle
 
-            # Conservative regex for handles (e.g. @alice.bsky.social)
-            for match in re.finditer(r'(?:^|\s)(@([A-Za-z0-9][A-Za-z0-9._-]{0,62}(?:\.[A-Za-z0-9][A-Za-z0-9._-]{0,62})+))', text):
-                full = match.group(1)
-                handle = match.group(2)
-
-                # Allow punctuation after mentions in prose (e.g. "hi @alice.bsky.social.")
-                # We keep facet offsets spanning only the handle itself.
-                handle = handle.rstrip(".,;:!?)\"]}\"")
-                full = "@" + handle
-
-                try:
-                    did = resolve_handle(pds, handle)
-                except Exception:
+            # Allow punctuation after mentions in prose (e.g. "hi @alice.bsky.social.")
+            # We keep facet offsets spanning only the handle itself.
+            mentions = [
+                (match.start(1), match.group(2).rstrip(_HANDLE_TRAILING_PUNCT))
+                for match in _MENTION_RE.finditer(text)
+            ]
+            pending = {handle for _, handle in mentions if (pds, handle) not in _HANDLE_DIDS}
+            if pending:
+                _HANDLE_DIDS.update(_resolve_handles(pds, pending, resolve_handle))
+
+            for start, handle in mentions:
+                did = _HANDLE_DIDS.get((pds, handle))
+                if did is None:
                     continue
 
-                byte_start = char_to_byte(match.start(1))
-                byte_end = byte_start + len(full.encode('utf-8'))
+                byte_start = char_to_byte(start)
+                byte_end = char_to_byte(start + 1 + len(handle))
                 facets.append({
                     "index": {"byteStart": byte_start, "byteEnd": byte_end},
                     "features": [{"$type": "app.bsky.richtext.facet#mention", "did": did}],
@@ -198,10 +243,8 @@ def resolve_post(pds: str, jwt: str, url: str) -> tuple[str, str] | None:
     Resolve a post URL to (uri, cid).
     Returns None if resolution fails.
     """
-    import re
-    
     # Parse URL: https://bsky.app/profile/HANDLE_OR_DID/post/RKEY
-    m = re.match(r"https://bsky\.app/profile/([^/]+)/post/([^/]+)", url)
+    m = _POST_URL_RE.match(url)
     if not m:
         return None
     
@@ -209,17 +252,21 @@ def resolve_post(pds: str, jwt: str, url: str) -> tuple[str, str] | None:
     
     # Resolve handle to DID if needed
     if not actor.startswith("did:"):
-        try:
-            r = requests.get(
-                f"{pds}/xrpc/com.atproto.identity.resolveHandle",
-                headers={"Authorization": f"Bearer {jwt}"},
-                params={"handle": actor},
-                timeout=10
-            )
-            r.raise_for_status()
-            actor = r.json()["did"]
-        except Exception:
-            return None
+        did = _HANDLE_DIDS.get((pds, actor))
+        if did is None:
+            try:
+                r = requests.get(
+                    f"{pds}/xrpc/com.atproto.identity.resolveHandle",
+                    headers={"Authorization": f"Bearer {jwt}"},
+                    params={"handle": actor},
+                    timeout=10
+                )
+                r.raise_for_status()
+                did = r.json()["did"]
+            except Exception:
+                return None
+            _HANDLE_DIDS[(pds, actor)] = did
+        actor = did
     
     # Build URI and fetch post to get CID
     uri = f"at://{actor}/app.bsky.feed.post/{rkey}"
@@ -333,11 +380,16 @@ _STOPWORDS = {
 }
 
 
+_TOPIC_URL_RE = re.compile(r"https?://\S+")
+_TOPIC_SIGIL_RE = re.compile(r"[@#][\w.:-]+")
+_TOPIC_WORD_RE = re.compile(r"[a-zà-ÿ0-9']{3,}", re.IGNORECASE)
+
+
 def _topic_tokens(text: str) -> set[str]:
     # remove urls/handles/hashtags, keep words
-    text = re.sub(r"https?://\S+", " ", text.lower())
-    text = re.sub(r"[@#][\w.:-]+", " ", text)
-    words = re.findall(r"[a-zà-ÿ0-9']{3,}", text, flags=re.IGNORECASE)
+    text = _TOPIC_URL_RE.sub(" ", text.lower())
+    text = _TOPIC_SIGIL_RE.sub(" ", text)
+    words = _TOPIC_WORD_RE.findall(text)
     toks = {w.strip("'") for w in words if w not in _STOPWORDS}
     return {t for t in toks if len(t) >= 3}
 
@@ -492,7 +544,7 @@ def run(args) -> int:
     )
     
     uri = res.get("uri", "")
-    m = re.match(r"^at://([^/]+)/app\.bsky\.feed\.post/([^/]+)$", uri)
+    m = _AT_POST_URI_RE.match(uri)
     if m:
         print(f"https://bsky.app/profile/{m.group(1)}/post/{m.group(2)}")
     else:
@@ -23,7 +23,7 @@ class RateLimiter:
         sleep_for = 0.0
         while True:
             with self._lock:
-                now = time.time()
+                now = time.monotonic()
                 cutoff = now - 60
                 while self._calls and self._calls[0] < cutoff:
                     self._calls.popleft()
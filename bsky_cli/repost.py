@@ -82,29 +82,39 @@ def unrepost(pds: str, jwt: str, did: str, post_uri: str) -> bool:
         return False
     
     # Find and delete our repost record
-    # List our reposts to find the rkey
-    r = requests.get(
-        f"{pds}/xrpc/com.atproto.repo.listRecords",
-        params={
+    # Page through our reposts (newest first) until the rkey turns up
+    repost_rkey = None
+    cursor = None
+    while True:
+        params = {
             "repo": did,
             "collection": "app.bsky.feed.repost",
             "limit": 100
-        },
-        headers={"Authorization": f"Bearer {jwt}"},
-        timeout=15
-    )
-    
-    if r.status_code != 200:
-        print(f"Could not list reposts: {r.status_code}")
-        return False
-    
-    records = r.json().get("records", [])
-    repost_rkey = None
-    for record in records:
-        if record.get("value", {}).get("subject", {}).get("uri") == post_uri:
-            # Extract rkey from uri: at://did/collection/rkey
-            repost_rkey = record.get("uri", "").split("/")[-1]
+        }
+        if cursor:
+            params["cursor"] = cursor
+        r = requests.get(
+            f"{pds}/xrpc/com.atproto.repo.listRecords",
+            params=params,
+            headers={"Authorization": f"Bearer {jwt}"},
+            timeout=15
+        )
+
+        if r.status_code != 200:
+            print(f"Could not list reposts: {r.status_code}")
+            return False
+
+        data = r.json()
+        for record in data.get("records", []):
+            if record.get("value", {}).get("subject", {}).get("uri") == post_uri:
+                # Extract rkey from uri: at://did/collection/rkey
+                repost_rkey = record.get("uri", "").split("/")[-1]
+                break
+
+        next_cursor = data.get("cursor")
+        if repost_rkey or not next_cursor or next_cursor == cursor:
             break
+        cursor = next_cursor
     
     if not repost_rkey:
         print("Could not find repost record")
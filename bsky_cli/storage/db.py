@@ -345,10 +345,17 @@ CREATE INDEX IF NOT EXISTS idx_threads_mod_eval_time ON threads_mod_evaluated_no
 """
 
 
+# Names of the tables/indexes/triggers created by RECONCILE_SCHEMA_SQL; lets
+# ensure_schema skip the script with one sqlite_master lookup when nothing is missing.
+_RECONCILE_OBJECTS = frozenset(
+    re.findall(r"CREATE (?:VIRTUAL )?(?:TABLE|INDEX|TRIGGER) IF NOT EXISTS (\w+)", RECONCILE_SCHEMA_SQL)
+)
+
+
 def ensure_schema(conn: sqlite3.Connection) -> None:
     conn.execute("CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')))")
-    cur = conn.execute("SELECT COALESCE(MAX(version), 0) AS v FROM schema_migrations")
-    current = int(cur.fetchone()["v"])
+    cur = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    current = int(cur.fetchone()[0])
 
     for idx, sql in enumerate(MIGRATIONS, start=1):
         if idx <= current:
@@ -360,10 +367,22 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
     # Self-heal partial/broken DBs that claim a high migration version but miss
     # tables/triggers (observed on legacy account DBs). Keep this idempotent and
     # avoid one-shot backfill DML to prevent duplicate rows.
+    if _schema_complete(conn):
+        return
     with conn:
         conn.executescript(RECONCILE_SCHEMA_SQL)
 
 
+def _schema_complete(conn: sqlite3.Connection) -> bool:
+    """True when every object RECONCILE_SCHEMA_SQL would create already exists."""
+    placeholders = ",".join(["?"] * len(_RECONCILE_OBJECTS))
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",
+        tuple(_RECONCILE_OBJECTS),
+    ).fetchone()
+    return row[0] == len(_RECONCILE_OBJECTS)
+
+
 # -----------------------------------------------------------------------------
 # DMs (ingestion)
 # -----------------------------------------------------------------------------
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from .api import get_profile, get_thread
 from .models import Branch, InterlocutorProfile, TrackedThread
 from .scoring import score_branch, score_interlocutor, score_thread_dynamics, score_topic_relevance
@@ -25,6 +27,7 @@ def analyze_thread(pds: str, jwt: str, our_did: str, root_uri: str) -> TrackedTh
     our_reply_texts: list[str] = []  # For consistency checking
     all_interlocutor_dids: set[str] = set()
     engaged_interlocutors: set[str] = set()  # People we've replied to
+    branch_texts: dict[str, str] = {}  # Reply text per branch, for topic drift
     latest_activity = root_record.get("createdAt", "")
     
     def walk_thread(node: dict, parent_is_ours: bool = False, branch_key: str | None = None, parent_author_did: str | None = None):
@@ -75,9 +78,7 @@ def analyze_thread(pds: str, jwt: str, our_did: str, root_uri: str) -> TrackedTh
             if created > branch.last_activity_at:
                 branch.last_activity_at = created
             # Accumulate text for topic drift calculation
-            if not hasattr(branch, '_accumulated_text'):
-                branch._accumulated_text = ""
-            branch._accumulated_text += " " + text
+            branch_texts[branch_key] = branch_texts.get(branch_key, "") + " " + text
         
         # Recurse into replies
         for reply in node.get("replies", []):
@@ -86,12 +87,8 @@ def analyze_thread(pds: str, jwt: str, our_did: str, root_uri: str) -> TrackedTh
     walk_thread(thread)
     
     # Calculate topic drift for each branch
-    for branch in branches.values():
-        branch_text = getattr(branch, '_accumulated_text', "")
-        branch.topic_drift = calculate_topic_drift(root_text, branch_text)
-        # Clean up temp attribute
-        if hasattr(branch, '_accumulated_text'):
-            delattr(branch, '_accumulated_text')
+    for key, branch in branches.items():
+        branch.topic_drift = calculate_topic_drift(root_text, branch_texts.get(key, ""))
     
     # Fetch interlocutor profiles for scoring
     profiles: dict[str, InterlocutorProfile] = {}
@@ -101,8 +98,17 @@ def analyze_thread(pds: str, jwt: str, our_did: str, root_uri: str) -> TrackedTh
             profiles[did] = profile
     
     # Score branches (pass engaged_interlocutors to relax drift for ongoing conversations)
+    profile_scores: dict[str, float] = {}
+    now_epoch = time.time()
     for branch in branches.values():
-        branch.branch_score = score_branch(branch, main_topics, profiles, engaged_interlocutors)
+        branch.branch_score = score_branch(
+            branch,
+            main_topics,
+            profiles,
+            engaged_interlocutors,
+            profile_scores=profile_scores,
+            now_epoch=now_epoch,
+        )
     
     # Calculate overall thread score
     total_replies = root_post.get("replyCount", 0)
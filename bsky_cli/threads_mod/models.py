@@ -1,9 +1,46 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 
+# Serialized field order for to_dict(); attrgetter reads them all in one call.
+_BRANCH_FIELDS = (
+    "our_reply_uri",
+    "our_reply_url",
+    "interlocutors",
+    "interlocutor_dids",
+    "last_activity_at",
+    "message_count",
+    "topic_drift",
+    "branch_score",
+)
+_branch_values = attrgetter(*_BRANCH_FIELDS)
 
-@dataclass
+_THREAD_FIELDS = (
+    "root_uri",
+    "root_url",
+    "root_author_handle",
+    "root_author_did",
+    "main_topics",
+    "root_text",
+    "overall_score",
+    "branches",
+    "total_our_replies",
+    "created_at",
+    "last_activity_at",
+    "engaged_interlocutors",
+    "our_reply_texts",
+    "cron_id",
+    "enabled",
+    "backoff_level",
+    "last_check_at",
+    "last_new_activity_at",
+)
+_thread_values = attrgetter(*_THREAD_FIELDS)
+
+
+@dataclass(slots=True)
 class Branch:
     our_reply_uri: str
     our_reply_url: str
@@ -15,34 +52,25 @@ class Branch:
     branch_score: float
 
     def to_dict(self) -> dict:
-        return {
-            "our_reply_uri": self.our_reply_uri,
-            "our_reply_url": self.our_reply_url,
-            "interlocutors": self.interlocutors,
-            "interlocutor_dids": self.interlocutor_dids,
-            "last_activity_at": self.last_activity_at,
-            "message_count": self.message_count,
-            "topic_drift": self.topic_drift,
-            "branch_score": self.branch_score,
-        }
+        return dict(zip(_BRANCH_FIELDS, _branch_values(self)))
 
     @classmethod
     def from_dict(cls, d: dict) -> "Branch":
-        allowed_fields = {
-            "our_reply_uri",
-            "our_reply_url",
-            "interlocutors",
-            "interlocutor_dids",
-            "last_activity_at",
-            "message_count",
-            "topic_drift",
-            "branch_score",
-        }
-        filtered = {k: v for k, v in d.items() if k in allowed_fields}
-        return cls(**filtered)
+        # Pick known keys explicitly; legacy keys (e.g. "messages") are ignored.
+        return cls(
+            our_reply_uri=d["our_reply_uri"],
+            our_reply_url=d["our_reply_url"],
+            interlocutors=d["interlocutors"],
+            # DIDs repeat across branches/threads; share one str object per DID.
+            interlocutor_dids=[sys.intern(x) for x in d["interlocutor_dids"]],
+            last_activity_at=d["last_activity_at"],
+            message_count=d["message_count"],
+            topic_drift=d["topic_drift"],
+            branch_score=d["branch_score"],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedThread:
     root_uri: str
     root_url: str
@@ -64,26 +92,9 @@ class TrackedThread:
     last_new_activity_at: str | None = None
 
     def to_dict(self) -> dict:
-        return {
-            "root_uri": self.root_uri,
-            "root_url": self.root_url,
-            "root_author_handle": self.root_author_handle,
-            "root_author_did": self.root_author_did,
-            "main_topics": self.main_topics,
-            "root_text": self.root_text,
-            "overall_score": self.overall_score,
-            "branches": {k: v.to_dict() for k, v in self.branches.items()},
-            "total_our_replies": self.total_our_replies,
-            "created_at": self.created_at,
-            "last_activity_at": self.last_activity_at,
-            "engaged_interlocutors": self.engaged_interlocutors,
-            "our_reply_texts": self.our_reply_texts,
-            "cron_id": self.cron_id,
-            "enabled": self.enabled,
-            "backoff_level": self.backoff_level,
-            "last_check_at": self.last_check_at,
-            "last_new_activity_at": self.last_new_activity_at,
-        }
+        d = dict(zip(_THREAD_FIELDS, _thread_values(self)))
+        d["branches"] = {k: v.to_dict() for k, v in self.branches.items()}
+        return d
 
     @classmethod
     def from_dict(cls, d: dict) -> "TrackedThread":
@@ -93,7 +104,6 @@ class TrackedThread:
                      "created_at", "last_activity_at")
         missing = [k for k in required if k not in d]
         if missing:
-            import sys
             print(f"⚠️  Skipping legacy thread entry (missing: {', '.join(missing)})",
                   file=sys.stderr)
             return None  # type: ignore[return-value]
@@ -103,7 +113,7 @@ class TrackedThread:
             root_uri=d["root_uri"],
             root_url=d["root_url"],
             root_author_handle=d["root_author_handle"],
-            root_author_did=d["root_author_did"],
+            root_author_did=sys.intern(d["root_author_did"]),
             main_topics=d["main_topics"],
             root_text=d.get("root_text", ""),
             overall_score=d["overall_score"],
@@ -111,7 +121,7 @@ class TrackedThread:
             total_our_replies=d.get("total_our_replies", 0),
             created_at=d["created_at"],
             last_activity_at=d["last_activity_at"],
-            engaged_interlocutors=d.get("engaged_interlocutors", []),
+            engaged_interlocutors=[sys.intern(x) for x in d.get("engaged_interlocutors", [])],
             our_reply_texts=d.get("our_reply_texts", []),
             cron_id=d.get("cron_id"),
             enabled=d.get("enabled", True),
@@ -121,7 +131,7 @@ class TrackedThread:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InterlocutorProfile:
     did: str
     handle: str
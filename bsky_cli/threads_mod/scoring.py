@@ -1,7 +1,9 @@
+import statistics
+import time
 from datetime import datetime, timezone
 
-from .config import RELEVANT_TOPICS
 from .models import Branch, InterlocutorProfile
+from .topics import count_topic_matches
 
 
 def score_interlocutor(profile: InterlocutorProfile) -> tuple[float, list[str]]:
@@ -34,8 +36,7 @@ def score_interlocutor(profile: InterlocutorProfile) -> tuple[float, list[str]]:
         score += 3
         reasons.append("active poster")
 
-    bio_lower = profile.description.lower()
-    topic_matches = sum(1 for t in RELEVANT_TOPICS if t.lower() in bio_lower)
+    topic_matches = count_topic_matches(profile.description)
     if topic_matches >= 3:
         score += 10
         reasons.append(f"highly relevant bio ({topic_matches} topics)")
@@ -92,8 +93,13 @@ def score_branch(
     main_topics: list[str],
     profiles: dict[str, InterlocutorProfile],
     engaged_interlocutors: set[str] | None = None,
+    profile_scores: dict[str, float] | None = None,
+    now_epoch: float | None = None,
 ) -> float:
     score = 0.0
+    # Per-pass cache of interlocutor scores keyed by DID, shared across branches.
+    if profile_scores is None:
+        profile_scores = {}
 
     already_engaged = False
     if engaged_interlocutors:
@@ -107,10 +113,13 @@ def score_branch(
     interlocutor_scores = []
     for did in branch.interlocutor_dids:
         if did in profiles:
-            int_score, _ = score_interlocutor(profiles[did])
+            int_score = profile_scores.get(did)
+            if int_score is None:
+                int_score, _ = score_interlocutor(profiles[did])
+                profile_scores[did] = int_score
             interlocutor_scores.append(int_score)
     if interlocutor_scores:
-        score += (sum(interlocutor_scores) / len(interlocutor_scores)) * 0.75
+        score += statistics.fmean(interlocutor_scores) * 0.75
 
     if branch.message_count >= 5:
         score += 20
@@ -121,7 +130,12 @@ def score_branch(
 
     try:
         last = datetime.fromisoformat(branch.last_activity_at.replace("Z", "+00:00"))
-        age_hours = (datetime.now(timezone.utc) - last).total_seconds() / 3600
+        if last.tzinfo is None:
+            # Naive timestamps are UTC, not local time
+            last = last.replace(tzinfo=timezone.utc)
+        if now_epoch is None:
+            now_epoch = time.time()
+        age_hours = (now_epoch - last.timestamp()) / 3600
         if age_hours < 1:
             score += 10
         elif age_hours < 6:
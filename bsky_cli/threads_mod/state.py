@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import json
 import sqlite3
 from datetime import datetime, timezone
@@ -14,7 +15,19 @@ def _now_suffix() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
+_conn: sqlite3.Connection | None = None
+
+
 def _open_default_db() -> sqlite3.Connection:
+    """Return the per-process threads_mod connection, opening it on first use."""
+    global _conn
+    if _conn is None:
+        _conn = _connect_default_db()
+        atexit.register(_conn.close)
+    return _conn
+
+
+def _connect_default_db() -> sqlite3.Connection:
     """Open per-account SQLite without requiring a network session."""
     env = load_from_pass() or {}
     account_handle = (env.get("BSKY_HANDLE") or env.get("BSKY_EMAIL") or "").strip() or "default"
@@ -57,18 +70,19 @@ def load_threads_state() -> dict:
     """
     conn = _open_default_db()
 
+    # Iterate cursors directly rather than materializing fetchall() lists.
     threads: dict[str, dict] = {}
-    for r in conn.execute("SELECT root_uri, thread_json FROM threads_mod_threads").fetchall():
+    for r in conn.execute("SELECT root_uri, thread_json FROM threads_mod_threads"):
         try:
-            threads[str(r["root_uri"])] = json.loads(str(r["thread_json"]))
+            threads[r[0]] = json.loads(r[1])
         except Exception:
             continue
 
     evaluated = [
-        str(r["notif_uri"])
+        r[0]
         for r in conn.execute(
             "SELECT notif_uri FROM threads_mod_evaluated_notifications ORDER BY rowid"
-        ).fetchall()
+        )
     ]
 
     row = conn.execute(
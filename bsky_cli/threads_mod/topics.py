@@ -1,9 +1,17 @@
 from .config import RELEVANT_TOPICS
 
+# (topic, lowercased needle) pairs, lowered once at import.
+_TOPIC_NEEDLES = tuple((t, t.lower()) for t in RELEVANT_TOPICS)
+
 
 def extract_topics(text: str) -> list[str]:
     text_lower = text.lower()
-    return [t for t in RELEVANT_TOPICS if t.lower() in text_lower]
+    return [t for t, needle in _TOPIC_NEEDLES if needle in text_lower]
+
+
+def count_topic_matches(text: str) -> int:
+    text_lower = text.lower()
+    return sum(1 for _, needle in _TOPIC_NEEDLES if needle in text_lower)
 
 
 def calculate_topic_drift(root_text: str, branch_text: str) -> float:
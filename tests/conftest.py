@@ -1,7 +1,32 @@
 """Pytest configuration and fixtures."""
+import sqlite3
+from dataclasses import dataclass, replace
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+# Imported once here (before test modules are collected) so fixtures below can
+# reference them directly instead of importing inside each fixture call.
+from bsky_cli import context_cmd
+from bsky_cli import dm as dm_mod
+from bsky_cli import notify as notify_mod
+from bsky_cli import organic
+from bsky_cli import post as post_mod
+from bsky_cli.storage import ensure_schema
+
+
+@pytest.fixture(autouse=True)
+def _no_organic_sleep(monkeypatch):
+    """Never wait out organic's LLM retry backoff in tests."""
+    monkeypatch.setattr(organic, "sleep", lambda _s: None)
+
+
+@pytest.fixture(autouse=True)
+def _empty_handle_cache(monkeypatch):
+    """Start every test without handle->DID resolutions cached by bsky_cli.post."""
+    monkeypatch.setattr(post_mod, "_HANDLE_DIDS", {})
+
 
 @pytest.fixture
 def mock_session():
@@ -19,6 +44,144 @@ def mock_session():
 @pytest.fixture
 def mock_requests():
     """Mock requests library."""
-    with patch('requests.get') as mock_get, \
-         patch('requests.post') as mock_post:
+    with patch('requests.Session.get') as mock_get, \
+         patch('requests.Session.post') as mock_post:
         yield {'get': mock_get, 'post': mock_post}
+
+
+# Ephemeral single-threaded test DBs need no durability guarantees. The
+# journal stays (in memory) so transactions and rollbacks behave as in
+# production; only the never-rolled-back schema template drops it.
+_TEST_DB_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def _apply_test_pragmas(conn):
+    for pragma in _TEST_DB_PRAGMAS:
+        conn.execute(pragma)
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory DB with the full storage schema, built once per session."""
+    tmpl = sqlite3.connect(":memory:")
+    tmpl.row_factory = sqlite3.Row
+    _apply_test_pragmas(tmpl)
+    tmpl.execute("PRAGMA journal_mode=OFF")
+    ensure_schema(tmpl)
+    yield tmpl
+    tmpl.close()
+
+
+@pytest.fixture
+def fresh_db(request, _schema_template):
+    """Fresh in-memory DB cloned from the schema template (no DDL re-run).
+
+    Rows are plain tuples unless the test is marked ``rows_by_name``.
+    """
+    conn = sqlite3.connect(":memory:")
+    if request.node.get_closest_marker("rows_by_name"):
+        conn.row_factory = sqlite3.Row
+    # Pragmas are per-connection and are not carried over by backup().
+    _apply_test_pragmas(conn)
+    _schema_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def context_cmd_stubs(monkeypatch, fresh_db):
+    """Offline context_cmd: fixed session/target DID, fresh_db as the store.
+
+    Returns the DB connection; tests override individual stubs as needed.
+    """
+    monkeypatch.setattr(
+        context_cmd,
+        "get_session",
+        lambda: ("https://pds.invalid", "did:me", "jwt", "echo.0mg.cc"),
+    )
+    monkeypatch.setattr(context_cmd, "resolve_handle", lambda pds, h: "did:plc:target")
+    monkeypatch.setattr(context_cmd, "open_db", lambda account_handle: fresh_db)
+    # Avoid importing from real legacy JSON
+    monkeypatch.setattr(context_cmd, "import_interlocutors_json", lambda conn: 0)
+    monkeypatch.setattr(context_cmd, "_get_root_uri_for_post_uri", lambda *a, **k: "at://root")
+    monkeypatch.setattr(context_cmd, "_get_post_text", lambda *a, **k: "root text")
+    return fresh_db
+
+
+@pytest.fixture
+def context_args():
+    """Factory for `bsky context` args: context_args(dm=5, threads=0, ...)."""
+
+    def _make(**overrides):
+        base = dict(handle="target.example", dm=0, threads=0, json=False, focus=None)
+        base.update(overrides)
+        return SimpleNamespace(**base)
+
+    return _make
+
+
+@dataclass(frozen=True, slots=True)
+class NotifyArgs:
+    """`bsky notify` CLI args as seen by notify.run / notify_scored.run_scored."""
+    all: bool = False
+    json: bool = False
+    limit: int = 50
+    no_dm: bool = True
+    mark_read: bool = False
+    score: bool = False
+    execute: bool = False
+    quiet: bool = False
+    allow_replies: bool = False
+    max_replies: int | None = None
+    max_likes: int | None = None
+    max_follows: int | None = None
+
+
+_NOTIFY_ARGS = NotifyArgs()
+
+
+@pytest.fixture
+def notify_args():
+    """Factory for notify args: notify_args(execute=True, quiet=True, ...)."""
+    return lambda **overrides: replace(_NOTIFY_ARGS, **overrides)
+
+
+@pytest.fixture
+def notify_stub(monkeypatch):
+    """Network-free session, notification feed and seen cursors in bsky_cli.notify.
+
+    Set ``notifications`` and ``last_seen``; ``saved`` collects local cursors
+    passed to save_last_seen and ``seen_updates`` the server updateSeen calls.
+    """
+    state = SimpleNamespace(notifications=[], last_seen=None, saved=[], seen_updates=[])
+    monkeypatch.setattr(notify_mod, "get_session", lambda: ("https://pds", "did:me", "jwt", "me.bsky.social"))
+    monkeypatch.setattr(notify_mod, "get_notifications", lambda pds, jwt, limit=50: state.notifications)
+    monkeypatch.setattr(notify_mod, "get_last_seen", lambda: state.last_seen)
+    monkeypatch.setattr(notify_mod, "save_last_seen", state.saved.append)
+    monkeypatch.setattr(notify_mod, "update_seen", lambda pds, jwt, seen_at: state.seen_updates.append(seen_at))
+    return state
+
+
+@pytest.fixture
+def fake_dm(monkeypatch):
+    """Dict-driven stand-in for the DM API and last-seen cursor in bsky_cli.dm.
+
+    Set ``convos`` and ``messages`` (keyed by convo id); ``saved`` records the
+    cursor passed to save_dm_last_seen.
+    """
+    state = SimpleNamespace(last_seen="2026-02-10T00:00:00Z", saved=None, convos=[], messages={})
+    monkeypatch.setattr(dm_mod, "get_dm_last_seen", lambda: state.last_seen)
+    monkeypatch.setattr(dm_mod, "save_dm_last_seen", lambda ts: setattr(state, "saved", ts))
+    monkeypatch.setattr(dm_mod, "get_dm_conversations", lambda pds, jwt, limit=20: state.convos)
+    monkeypatch.setattr(
+        dm_mod,
+        "get_dm_messages",
+        lambda pds, jwt, convo_id, limit=20: state.messages.get(convo_id, []),
+    )
+    return state
@@ -67,7 +67,7 @@ class TestCreateSession:
             "handle": "test.bsky.social"
         }
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.return_value = mock_response
             result = auth.create_session(
                 "https://bsky.social",
@@ -84,7 +84,7 @@ class TestCreateSession:
 
     def test_strips_trailing_slash_from_pds(self):
         """Should handle PDS URL with trailing slash."""
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.return_value = MagicMock(json=lambda: {"did": "x"})
             auth.create_session("https://bsky.social/", "id", "pw")
         
@@ -95,6 +95,12 @@ class TestCreateSession:
 class TestGetSession:
     """Tests for get_session function."""
 
+    @pytest.fixture(autouse=True)
+    def _no_cached_session(self):
+        auth.clear_session_cache()
+        yield
+        auth.clear_session_cache()
+
     def test_returns_session_tuple(self):
         """Should return (pds, did, jwt, handle) tuple."""
         mock_creds = {
@@ -158,6 +164,21 @@ class TestGetSession:
         call_args = mock_create.call_args[0]
         assert call_args[1] == "test@example.com"
 
+    def test_reuses_session_until_cleared(self):
+        """Should log in once and serve later calls from the cache."""
+        mock_creds = {"BSKY_HANDLE": "test.bsky.social", "BSKY_APP_PASSWORD": "secret"}
+        mock_session = {"did": "did:plc:test", "accessJwt": "jwt123", "didDoc": {}}
+
+        with patch.object(auth, 'load_credentials', return_value=mock_creds), \
+             patch.object(auth, 'create_session', return_value=mock_session) as mock_create:
+            first = auth.get_session()
+            second = auth.get_session()
+            auth.clear_session_cache()
+            auth.get_session()
+
+        assert first == second
+        assert mock_create.call_count == 2
+
     def test_exits_when_credentials_missing(self):
         """Should exit when required credentials are missing."""
         mock_creds = {"BSKY_HANDLE": "test"}  # Missing password
@@ -188,7 +209,7 @@ class TestResolveHandle:
 
     def test_returns_did_unchanged(self):
         """Should return DID as-is without API call."""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             result = auth.resolve_handle("https://bsky.social", "did:plc:abc123")
         
         mock_get.assert_not_called()
@@ -199,7 +220,7 @@ class TestResolveHandle:
         mock_response = MagicMock()
         mock_response.json.return_value = {"did": "did:plc:resolved"}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             result = auth.resolve_handle("https://bsky.social", "test.bsky.social")
         
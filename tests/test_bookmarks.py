@@ -1,6 +1,6 @@
 """Tests for bookmarks module."""
 
-from unittest.mock import MagicMock, patch
+import pytest
 
 from bsky_cli.bookmarks import (
     parse_post_url,
@@ -11,6 +11,21 @@ from bsky_cli.bookmarks import (
     get_bookmarks,
 )
 
+PDS = "https://pds.test"
+POST_URL = "https://bsky.app/profile/alice.bsky.social/post/abc123"
+POST_URI = "at://did:plc:alice/app.bsky.feed.post/abc123"
+
+
+@pytest.fixture
+def post_lookup(requests_mock):
+    """Serve the handle + getPosts lookups behind resolve_post_uri_and_cid."""
+    requests_mock.get(f"{PDS}/xrpc/com.atproto.identity.resolveHandle", json={"did": "did:plc:alice"})
+    requests_mock.get(
+        f"{PDS}/xrpc/app.bsky.feed.getPosts",
+        json={"posts": [{"uri": POST_URI, "cid": "bafyreicid123"}]},
+    )
+    return requests_mock
+
 
 def test_parse_post_url_valid():
     parsed = parse_post_url("https://bsky.app/profile/alice.bsky.social/post/abc123")
@@ -21,38 +36,36 @@ def test_parse_post_url_invalid():
     assert parse_post_url("https://example.com") is None
 
 
-@patch("bsky_cli.bookmarks.requests.get")
-def test_resolve_post_uri_handle(mock_get):
-    mock_get.return_value = MagicMock(status_code=200, json=lambda: {"did": "did:plc:alice"})
-    uri = resolve_post_uri("https://pds.test", "jwt", "https://bsky.app/profile/alice.bsky.social/post/abc123")
-    assert uri == "at://did:plc:alice/app.bsky.feed.post/abc123"
+def test_resolve_post_uri_handle(requests_mock):
+    requests_mock.get(f"{PDS}/xrpc/com.atproto.identity.resolveHandle", json={"did": "did:plc:alice"})
+    uri = resolve_post_uri(PDS, "jwt", POST_URL)
+    assert uri == POST_URI
+    assert requests_mock.last_request.qs == {"handle": ["alice.bsky.social"]}
+
+
+def test_resolve_post_uri_and_cid(post_lookup):
+    assert resolve_post_uri_and_cid(PDS, "jwt", POST_URL) == (POST_URI, "bafyreicid123")
 
 
-@patch("bsky_cli.bookmarks.requests.post")
-@patch("bsky_cli.bookmarks.resolve_post_uri_and_cid")
-def test_create_bookmark_success(mock_resolve, mock_post):
-    mock_resolve.return_value = ("at://did:plc:alice/app.bsky.feed.post/abc123", "bafyreicid123")
-    mock_post.return_value = MagicMock(status_code=200, text="")
+def test_create_bookmark_success(post_lookup):
+    post_lookup.post(f"{PDS}/xrpc/app.bsky.bookmark.createBookmark", text="")
 
-    assert create_bookmark("https://pds.test", "jwt", "did:plc:me", "https://bsky.app/profile/a/post/b") is True
+    assert create_bookmark(PDS, "jwt", "did:plc:me", POST_URL) is True
+    assert post_lookup.last_request.json() == {"uri": POST_URI, "cid": "bafyreicid123"}
 
 
-@patch("bsky_cli.bookmarks.requests.post")
-@patch("bsky_cli.bookmarks.resolve_post_uri_and_cid")
-def test_delete_bookmark_success(mock_resolve, mock_post):
-    mock_resolve.return_value = ("at://did:plc:alice/app.bsky.feed.post/abc123", "bafyreicid123")
-    mock_post.return_value = MagicMock(status_code=200, text="")
+def test_delete_bookmark_success(post_lookup):
+    post_lookup.post(f"{PDS}/xrpc/app.bsky.bookmark.deleteBookmark", text="")
 
-    assert delete_bookmark("https://pds.test", "jwt", "did:plc:me", "https://bsky.app/profile/a/post/b") is True
+    assert delete_bookmark(PDS, "jwt", "did:plc:me", POST_URL) is True
+    assert post_lookup.last_request.json() == {"uri": POST_URI, "cid": "bafyreicid123"}
 
 
-@patch("bsky_cli.bookmarks.requests.get")
-def test_get_bookmarks(mock_get):
-    mock_get.return_value = MagicMock(
-        status_code=200,
-        json=lambda: {"bookmarks": [{"post": {"uri": "at://x"}}]},
-        text="",
+def test_get_bookmarks(requests_mock):
+    requests_mock.get(
+        f"{PDS}/xrpc/app.bsky.bookmark.getBookmarks",
+        json={"bookmarks": [{"post": {"uri": "at://x"}}]},
     )
 
-    items = get_bookmarks("https://pds.test", "jwt", 10)
+    items = get_bookmarks(PDS, "jwt", 10)
     assert len(items) == 1
@@ -1,10 +1,48 @@
 from __future__ import annotations
 
-import sqlite3
-from types import SimpleNamespace
-
 from bsky_cli import context_cmd
 
+_FOCUS_URI = "at://did:plc:target/app.bsky.feed.post/abc"
+_ROOT_URI = "at://did:plc:root/app.bsky.feed.post/root"
+
+# getPostThread response for the focus post: root parent + one branching reply.
+# context_cmd only reads it, so one shared instance is enough.
+_FAKE_THREAD = {
+    "post": {
+        "uri": _FOCUS_URI,
+        "author": {"handle": "target.example"},
+        "record": {"text": "focus text"},
+    },
+    "parent": {
+        "post": {
+            "uri": _ROOT_URI,
+            "author": {"handle": "root.author"},
+            "record": {"text": "root text"},
+        },
+        "parent": None,
+        "replies": [],
+    },
+    "replies": [
+        {
+            "post": {
+                "uri": "at://did:plc:x/app.bsky.feed.post/r1",
+                "author": {"handle": "alice.example"},
+                "record": {"text": "reply one"},
+            },
+            "parent": None,
+            "replies": [],
+        }
+    ],
+}
+
+_EXPECTED_PACK_SUBSTRS = (
+    "[HOT CONTEXT",
+    "[COLD CONTEXT",
+    "@alice.example: hello",
+    "Actor: @alice.example",
+    "Tags: friendly",
+)
+
 
 def test_format_context_pack_includes_hot_and_cold_sections():
     txt = context_cmd._format_context_pack(
@@ -26,61 +64,39 @@ def test_format_context_pack_includes_hot_and_cold_sections():
         }
     )
 
-    assert "[HOT CONTEXT" in txt
-    assert "[COLD CONTEXT" in txt
-    assert "@alice.example: hello" in txt
-    assert "Actor: @alice.example" in txt
-    assert "Tags: friendly" in txt
-
-
-def test_context_run_smoke(monkeypatch, capsys):
-    # Patch session
-    monkeypatch.setattr(
-        context_cmd,
-        "get_session",
-        lambda: ("https://pds.invalid", "did:me", "jwt", "echo.0mg.cc"),
-    )
-
-    # Patch DID resolution
-    monkeypatch.setattr(context_cmd, "resolve_handle", lambda pds, h: "did:plc:target")
-
-    # In-memory DB
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-
-    monkeypatch.setattr(context_cmd, "open_db", lambda account_handle: conn)
-
-    # Avoid importing from real legacy JSON
-    monkeypatch.setattr(context_cmd, "import_interlocutors_json", lambda conn: 0)
-
-    # Seed actor + one interaction with post_uri
-    context_cmd.ensure_schema(conn)
-    conn.execute(
-        "INSERT INTO actors(did, handle, first_seen, last_interaction, total_count, notes_manual) VALUES (?,?,?,?,?,?)",
-        ("did:plc:target", "target.example", "2026-02-01", "2026-02-02", 1, ""),
-    )
-    conn.execute(
-        "INSERT INTO interactions(actor_did, date, type, post_uri, our_text, their_text) VALUES (?,?,?,?,?,?)",
-        (
-            "did:plc:target",
-            "2026-02-02",
-            "reply_to_them",
-            "at://did:plc:target/app.bsky.feed.post/abc",
-            "our msg",
-            "their msg",
-        ),
-    )
-    conn.commit()
-
-    # Seed DMs in DB (DB-first hot context)
-    conn.execute("INSERT OR IGNORE INTO dm_conversations(convo_id, last_message_at) VALUES (?,?)", ("c1", "2026-02-10T00:00:00Z"))
-    conn.execute("INSERT OR IGNORE INTO dm_convo_members(convo_id, did) VALUES (?,?)", ("c1", "did:plc:target"))
-    conn.execute("INSERT OR IGNORE INTO dm_convo_members(convo_id, did) VALUES (?,?)", ("c1", "did:me"))
-    conn.execute(
-        "INSERT OR IGNORE INTO dm_messages(convo_id, msg_id, actor_did, direction, sent_at, text) VALUES (?,?,?,?,?,?)",
-        ("c1", "m1", "did:plc:target", "in", "2026-02-10T00:00:00Z", "hello from dm"),
-    )
-    conn.commit()
+    missing = [s for s in _EXPECTED_PACK_SUBSTRS if s not in txt]
+    assert not missing, f"missing: {missing}"
+
+
+def test_context_run_smoke(context_cmd_stubs, context_args, monkeypatch, capsysbinary):
+    conn = context_cmd_stubs
+
+    # Seed actor + one interaction with post_uri, plus DMs in DB (DB-first hot context)
+    with conn:
+        conn.execute(
+            "INSERT INTO actors(did, handle, first_seen, last_interaction, total_count, notes_manual) VALUES (?,?,?,?,?,?)",
+            ("did:plc:target", "target.example", "2026-02-01", "2026-02-02", 1, ""),
+        )
+        conn.execute(
+            "INSERT INTO interactions(actor_did, date, type, post_uri, our_text, their_text) VALUES (?,?,?,?,?,?)",
+            (
+                "did:plc:target",
+                "2026-02-02",
+                "reply_to_them",
+                "at://did:plc:target/app.bsky.feed.post/abc",
+                "our msg",
+                "their msg",
+            ),
+        )
+        conn.execute("INSERT OR IGNORE INTO dm_conversations(convo_id, last_message_at) VALUES (?,?)", ("c1", "2026-02-10T00:00:00Z"))
+        conn.executemany(
+            "INSERT OR IGNORE INTO dm_convo_members(convo_id, did) VALUES (?,?)",
+            [("c1", "did:plc:target"), ("c1", "did:me")],
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO dm_messages(convo_id, msg_id, actor_did, direction, sent_at, text) VALUES (?,?,?,?,?,?)",
+            ("c1", "m1", "did:plc:target", "in", "2026-02-10T00:00:00Z", "hello from dm"),
+        )
 
     # Patch live DM fetch to ensure DB path is used (no network)
     monkeypatch.setattr(context_cmd, "_fetch_dm_context", lambda *a, **k: [])
@@ -89,103 +105,53 @@ def test_context_run_smoke(monkeypatch, capsys):
     monkeypatch.setattr(context_cmd, "_get_root_uri_for_post_uri", lambda pds, jwt, uri: "at://did:plc:target/app.bsky.feed.post/root")
     monkeypatch.setattr(context_cmd, "_get_post_text", lambda pds, jwt, uri: "root post text")
 
-    args = SimpleNamespace(handle="target.example", dm=1, threads=1, json=False)
+    args = context_args(dm=1, threads=1)
 
     rc = context_cmd.run(args)
     assert rc == 0
 
-    out = capsys.readouterr().out
-    assert "[HOT CONTEXT" in out
-    assert "hello from dm" in out
-    assert "root post text" in out
-
-
-def test_context_run_with_focus_includes_path_and_branches(monkeypatch, capsys):
-    # Patch session
-    monkeypatch.setattr(
-        context_cmd,
-        "get_session",
-        lambda: ("https://pds.invalid", "did:me", "jwt", "echo.0mg.cc"),
-    )
-
-    # Patch DID resolution
-    monkeypatch.setattr(context_cmd, "resolve_handle", lambda pds, h: "did:plc:target")
-
-    # In-memory DB
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    monkeypatch.setattr(context_cmd, "open_db", lambda account_handle: conn)
-
-    monkeypatch.setattr(context_cmd, "import_interlocutors_json", lambda conn: 0)
-
-    context_cmd.ensure_schema(conn)
-    conn.execute(
-        "INSERT INTO actors(did, handle) VALUES (?,?)",
-        ("did:plc:target", "target.example"),
-    )
-    conn.execute(
-        "INSERT INTO interactions(actor_did, date, type, post_uri, our_text, their_text) VALUES (?,?,?,?,?,?)",
-        (
-            "did:plc:target",
-            "2026-02-02",
-            "reply_to_them",
-            "at://did:plc:target/app.bsky.feed.post/abc",
-            "our msg",
-            "their msg",
-        ),
-    )
-    conn.commit()
+    out = capsysbinary.readouterr().out
+    assert b"[HOT CONTEXT" in out
+    assert b"hello from dm" in out
+    assert b"root post text" in out
+
+
+def test_context_run_with_focus_includes_path_and_branches(context_cmd_stubs, context_args, monkeypatch, capsysbinary):
+    conn = context_cmd_stubs
+
+    with conn:
+        conn.execute(
+            "INSERT INTO actors(did, handle) VALUES (?,?)",
+            ("did:plc:target", "target.example"),
+        )
+        conn.execute(
+            "INSERT INTO interactions(actor_did, date, type, post_uri, our_text, their_text) VALUES (?,?,?,?,?,?)",
+            (
+                "did:plc:target",
+                "2026-02-02",
+                "reply_to_them",
+                "at://did:plc:target/app.bsky.feed.post/abc",
+                "our msg",
+                "their msg",
+            ),
+        )
 
     monkeypatch.setattr(context_cmd, "_fetch_dm_context", lambda *a, **k: [])
 
-    focus_uri = "at://did:plc:target/app.bsky.feed.post/abc"
-    root_uri = "at://did:plc:root/app.bsky.feed.post/root"
-
     # Patch focus resolve + thread fetch
-    monkeypatch.setattr(context_cmd, "_resolve_focus_uri", lambda pds, jwt, focus: focus_uri)
-    monkeypatch.setattr(
-        context_cmd,
-        "_get_post_thread",
-        lambda pds, jwt, uri, depth=10: {
-            "post": {
-                "uri": focus_uri,
-                "author": {"handle": "target.example"},
-                "record": {"text": "focus text"},
-            },
-            "parent": {
-                "post": {
-                    "uri": root_uri,
-                    "author": {"handle": "root.author"},
-                    "record": {"text": "root text"},
-                },
-                "parent": None,
-                "replies": [],
-            },
-            "replies": [
-                {
-                    "post": {
-                        "uri": "at://did:plc:x/app.bsky.feed.post/r1",
-                        "author": {"handle": "alice.example"},
-                        "record": {"text": "reply one"},
-                    },
-                    "parent": None,
-                    "replies": [],
-                }
-            ],
-        },
-    )
+    monkeypatch.setattr(context_cmd, "_resolve_focus_uri", lambda pds, jwt, focus: _FOCUS_URI)
+    monkeypatch.setattr(context_cmd, "_get_post_thread", lambda pds, jwt, uri, depth=10: _FAKE_THREAD)
 
     # Avoid legacy per-interaction root lookups
-    monkeypatch.setattr(context_cmd, "_get_root_uri_for_post_uri", lambda pds, jwt, uri: root_uri)
-    monkeypatch.setattr(context_cmd, "_get_post_text", lambda pds, jwt, uri: "root text")
+    monkeypatch.setattr(context_cmd, "_get_root_uri_for_post_uri", lambda pds, jwt, uri: _ROOT_URI)
 
-    args = SimpleNamespace(handle="target.example", dm=0, threads=1, json=False, focus=focus_uri)
+    args = context_args(dm=0, threads=1, focus=_FOCUS_URI)
 
     rc = context_cmd.run(args)
     assert rc == 0
 
-    out = capsys.readouterr().out
-    assert "focus:" in out
-    assert "path:" in out
-    assert "branches:" in out
-    assert "reply one" in out
+    out = capsysbinary.readouterr().out
+    assert b"focus:" in out
+    assert b"path:" in out
+    assert b"branches:" in out
+    assert b"reply one" in out
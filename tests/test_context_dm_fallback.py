@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from bsky_cli import context_cmd
+
+_LIVE_DM = {
+    "sentAt": "2026-02-10T01:00:00Z",
+    "senderDid": "did:plc:target",
+    "senderHandle": "target.example",
+    "text": "live msg",
+}
+
+
+def _live_ok(*a, **k):
+    return [_LIVE_DM]
+
+
+def _live_offline(*a, **k):
+    raise RuntimeError("offline")
+
+
+@pytest.mark.parametrize(
+    "live,expected",
+    [
+        # DB holds 1 DM but 5 are requested → live fallback fills the HOT context.
+        (_live_ok, b"live msg"),
+        # Regression: live fallback should never break a working DB-backed HOT context.
+        (_live_offline, b"db msg"),
+    ],
+    ids=["live-fallback", "live-offline-keeps-db"],
+)
+def test_context_run_dm_fallback_when_db_partial(live, expected, context_cmd_stubs, context_args, monkeypatch, capsysbinary):
+    conn = context_cmd_stubs
+
+    with conn:
+        conn.execute("INSERT INTO actors(did, handle) VALUES (?,?)", ("did:plc:target", "target.example"))
+        conn.execute("INSERT OR IGNORE INTO dm_conversations(convo_id, last_message_at) VALUES (?,?)", ("c1", "2026-02-10T00:00:00Z"))
+        conn.executemany(
+            "INSERT OR IGNORE INTO dm_convo_members(convo_id, did) VALUES (?,?)",
+            [("c1", "did:plc:target"), ("c1", "did:me")],
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO dm_messages(convo_id, msg_id, actor_did, direction, sent_at, text) VALUES (?,?,?,?,?,?)",
+            ("c1", "m1", "did:plc:target", "in", "2026-02-10T00:00:00Z", "db msg"),
+        )
+
+    called = {"n": 0}
+
+    def _counting_live(*a, **k):
+        called["n"] += 1
+        return live(*a, **k)
+
+    monkeypatch.setattr(context_cmd, "_fetch_dm_context", _counting_live)
+
+    rc = context_cmd.run(context_args(dm=5, threads=0))
+    assert rc == 0
+    assert called["n"] == 1
+
+    out = capsysbinary.readouterr().out
+    assert expected in out
@@ -1,55 +1,57 @@
-from unittest.mock import patch
-
-from bsky_cli.discover import get_follows, DiscoverRuntimeTimeout
-
-
-class _Resp:
-    def __init__(self, payload):
-        self._payload = payload
-
-    def raise_for_status(self):
-        return None
-
-    def json(self):
-        return self._payload
-
-
-@patch("bsky_cli.discover.requests.get")
-def test_get_follows_stops_when_cursor_does_not_advance(mock_get):
-    # Reproduces a pagination loop where API keeps returning same cursor.
-    mock_get.return_value = _Resp({
-        "follows": [{"did": "did:example:a"}],
-        "cursor": "same-cursor",
-    })
-
-    follows = get_follows("https://example", "jwt", "did:me")
-
-    # Should terminate instead of looping forever.
-    assert len(follows) == 2
-    assert mock_get.call_count == 2
-
-
-@patch("bsky_cli.discover.requests.get")
-def test_get_follows_honors_max_pages_guard(mock_get):
-    counter = {"n": 0}
-
-    def _side_effect(*args, **kwargs):
-        counter["n"] += 1
-        return _Resp({
-            "follows": [{"did": f"did:example:{counter['n']}"}],
-            "cursor": f"cursor-{counter['n']}",
-        })
-
-    mock_get.side_effect = _side_effect
-
-    follows = get_follows("https://example", "jwt", "did:me", max_pages=3)
-
-    assert len(follows) == 3
-    assert mock_get.call_count == 3
-
-
-@patch("bsky_cli.discover.requests.get")
-def test_get_follows_respects_runtime_guard_between_pages(mock_get):
+import pytest
+
+from bsky_cli.discover import _cursor_advanced, get_follows, DiscoverRuntimeTimeout
+
+FOLLOWS_URL = "https://example/xrpc/app.bsky.graph.getFollows"
+
+
+def _pages(n):
+    """One getFollows page per call, each with a fresh cursor."""
+    return [
+        {"json": {"follows": [{"did": f"did:example:{i}"}], "cursor": f"cursor-{i}"}}
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.mark.parametrize(
+    "prev,nxt,seen,expected",
+    [
+        (None, "c1", set(), True),
+        ("c1", "c2", {"c1"}, True),
+        ("c1", "c1", set(), False),
+        ("c2", "c1", {"c1"}, False),
+        ("c1", None, set(), False),
+        ("c1", "", set(), False),
+    ],
+)
+def test_cursor_advanced(prev, nxt, seen, expected):
+    assert _cursor_advanced(prev, nxt, seen) is expected
+
+
+@pytest.mark.parametrize(
+    "responses,kwargs,expected",
+    [
+        # API keeps returning the same cursor: stop instead of looping forever.
+        (
+            [{"json": {"follows": [{"did": "did:example:a"}], "cursor": "same-cursor"}}],
+            {},
+            2,
+        ),
+        # Cursor keeps advancing: max_pages bounds the walk.
+        (_pages(5), {"max_pages": 3}, 3),
+    ],
+    ids=["stuck-cursor", "max-pages"],
+)
+def test_get_follows_pagination_stops(requests_mock, responses, kwargs, expected):
+    requests_mock.get(FOLLOWS_URL, responses)
+
+    follows = get_follows("https://example", "jwt", "did:me", **kwargs)
+
+    assert len(follows) == expected
+    assert requests_mock.call_count == expected
+
+
+def test_get_follows_respects_runtime_guard_between_pages(requests_mock):
     """Guard is checked between pagination pages inside get_follows()."""
 
     class PageGuard:
@@ -61,16 +63,7 @@ def test_get_follows_respects_runtime_guard_between_pages(mock_get):
             # Timeout just before starting page 3 (after 2 pages completed).
             return self.checks >= 5
 
-    counter = {"n": 0}
-
-    def _side_effect(*args, **kwargs):
-        counter["n"] += 1
-        return _Resp({
-            "follows": [{"did": f"did:example:{counter['n']}"}],
-            "cursor": f"cursor-{counter['n']}",
-        })
-
-    mock_get.side_effect = _side_effect
+    requests_mock.get(FOLLOWS_URL, _pages(5))
     guard = PageGuard()
 
     try:
@@ -80,12 +73,11 @@ def test_get_follows_respects_runtime_guard_between_pages(mock_get):
         pass
 
     # Guard fired before starting page 3 → only 2 pages completed
-    assert mock_get.call_count == 2
+    assert requests_mock.call_count == 2
     assert guard.checks == 5
 
 
-@patch("bsky_cli.discover.requests.get")
-def test_get_follows_checks_runtime_after_request(mock_get):
+def test_get_follows_checks_runtime_after_request(requests_mock):
     """Regression: if the *final* page fetch overruns the budget, we should still timeout."""
 
     class Guard:
@@ -96,7 +88,7 @@ def test_get_follows_checks_runtime_after_request(mock_get):
             # Allow the pre-request check, timeout right after the request returns.
             return self.checks >= 2
 
-    mock_get.return_value = _Resp({"follows": [{"did": "did:example:a"}]})
+    requests_mock.get(FOLLOWS_URL, json={"follows": [{"did": "did:example:a"}]})
 
     guard = Guard()
 
@@ -106,5 +98,5 @@ def test_get_follows_checks_runtime_after_request(mock_get):
     except DiscoverRuntimeTimeout:
         pass
 
-    assert mock_get.call_count == 1
+    assert requests_mock.call_count == 1
     assert guard.checks == 2
@@ -1,15 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
+from bsky_cli import dm as dm_mod
 
 
-def test_check_new_dms_skips_messages_from_self(monkeypatch, tmp_path: Path):
-    from bsky_cli import dm as dm_mod
-
-    # isolate state file
-    monkeypatch.setattr(dm_mod, "DM_STATE_FILE", tmp_path / "last_seen.txt")
-
-    fake_convos = [
+def test_check_new_dms_skips_messages_from_self(fake_dm):
+    fake_dm.convos = [
         {
             "id": "convo1",
             "unreadCount": 2,
@@ -20,7 +15,7 @@ def test_check_new_dms_skips_messages_from_self(monkeypatch, tmp_path: Path):
         }
     ]
 
-    fake_messages = [
+    fake_dm.messages["convo1"] = [
         {
             "id": "m1",
             "sender": {"did": "did:plc:me"},
@@ -43,9 +38,6 @@ def test_check_new_dms_skips_messages_from_self(monkeypatch, tmp_path: Path):
         },
     ]
 
-    monkeypatch.setattr(dm_mod, "get_dm_conversations", lambda pds, jwt, limit=20: fake_convos)
-    monkeypatch.setattr(dm_mod, "get_dm_messages", lambda pds, jwt, convo_id, limit=20: fake_messages)
-
     new = dm_mod.check_new_dms("https://pds", "jwt", my_did="did:plc:me")
 
     assert len(new) == 1
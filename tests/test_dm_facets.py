@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import pytest
 
-def test_send_dm_includes_facets_when_detected(monkeypatch):
-    from bsky_cli import dm as dm_mod
+from bsky_cli import dm as dm_mod
 
+
+class _Resp:
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"ok": True}
+
+
+@pytest.fixture
+def capture_post(monkeypatch):
+    """Replace dm.requests.post; returns a dict holding the last JSON payload."""
     captured = {}
 
-    def fake_post(url, headers=None, json=None, timeout=None):
+    def _post(url, headers=None, json=None, timeout=None):
         captured["json"] = json
+        return _Resp()
 
-        class R:
-            def raise_for_status(self):
-                return None
+    monkeypatch.setattr(dm_mod.requests, "post", _post)
+    return captured
 
-            def json(self):
-                return {"ok": True}
-
-        return R()
 
+def test_send_dm_includes_facets_when_detected(monkeypatch, capture_post):
     monkeypatch.setattr(
         dm_mod,
         "detect_facets",
@@ -30,36 +39,18 @@ def test_send_dm_includes_facets_when_detected(monkeypatch):
             }
         ],
     )
-    monkeypatch.setattr(dm_mod.requests, "post", fake_post)
 
     dm_mod.send_dm("https://pds", "jwt", "convo1", "hi https://example.com")
 
-    msg = captured["json"]["message"]
+    msg = capture_post["json"]["message"]
     assert msg["text"].startswith("hi")
     assert "facets" in msg
 
 
-def test_send_dm_omits_facets_when_none(monkeypatch):
-    from bsky_cli import dm as dm_mod
-
-    captured = {}
-
-    def fake_post(url, headers=None, json=None, timeout=None):
-        captured["json"] = json
-
-        class R:
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return {"ok": True}
-
-        return R()
-
+def test_send_dm_omits_facets_when_none(monkeypatch, capture_post):
     monkeypatch.setattr(dm_mod, "detect_facets", lambda text, pds=None: [])
-    monkeypatch.setattr(dm_mod.requests, "post", fake_post)
 
     dm_mod.send_dm("https://pds", "jwt", "convo1", "hello")
 
-    msg = captured["json"]["message"]
+    msg = capture_post["json"]["message"]
     assert msg == {"text": "hello"}
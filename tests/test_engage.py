@@ -62,6 +62,68 @@ class TestPost:
         post.add_multiplier("bonus", 3.0)
         assert post.final_score == 3.0
 
+    def test_final_score_tracks_later_changes(self):
+        """Should reflect multipliers and base_score set after a first read."""
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="2026-01-01T00:00:00Z"
+        )
+        post.add_multiplier("a", 2.0)
+        assert post.final_score == 2.0
+        post.add_multiplier("b", 3.0)
+        assert post.final_score == 6.0
+        post.base_score = 0.5
+        assert post.final_score == 3.0
+
+    def test_multipliers_view_and_no_instance_dict(self):
+        """Should expose multipliers by name on a slotted instance."""
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="2026-01-01T00:00:00Z"
+        )
+        post.add_multiplier("a", 2.0)
+        post.add_multiplier("b", 0.5)
+        post.add_multiplier("a", 3.0)
+        assert post.multipliers == {"a": 3.0, "b": 0.5}
+        assert not hasattr(post, "__dict__")
+
+    def test_created_dt_parsed_once(self):
+        """Should parse created_at lazily and reuse the result."""
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="2026-01-01T00:00:00Z"
+        )
+        first = post.created_dt
+        assert first == dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+        assert post.created_dt is first
+
+    def test_created_dt_follows_created_at(self):
+        """Should reparse after created_at is reassigned."""
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="2026-01-01T00:00:00Z"
+        )
+        assert post.created_dt.year == 2026
+        post.created_at = "2025-06-01T00:00:00Z"
+        assert post.created_dt == dt.datetime(2025, 6, 1, tzinfo=dt.timezone.utc)
+
+    def test_created_dt_uses_created_parsed(self):
+        """Should take an already parsed created_at from the constructor."""
+        parsed = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="2026-01-01T00:00:00Z", created_parsed=parsed
+        )
+        assert post.created_dt is parsed
+
+    def test_created_dt_unparseable(self):
+        """Should return None for malformed timestamps."""
+        post = Post(
+            uri="x", cid="x", author_did="x", author_handle="x",
+            text="test", created_at="x"
+        )
+        assert post.created_dt is None
+
 
 # ============================================================================
 # Filter Tests
@@ -249,6 +311,16 @@ class TestFreshPostBonus:
         )
         assert m.calculate(post, {}) == 1.1
 
+    def test_uses_now_from_state(self):
+        """Should measure age against the pipeline's shared clock reading."""
+        m = FreshPostBonus()
+        post = Post(
+            uri="x", cid="x", author_did="x",
+            author_handle="x", text="test", created_at="2026-01-01T00:00:00Z"
+        )
+        now = dt.datetime(2026, 1, 1, 0, 30, tzinfo=dt.timezone.utc)
+        assert m.calculate(post, {"_now": now}) == 1.3
+
     def test_old_post_no_bonus(self):
         """Should give no bonus for older posts."""
         m = FreshPostBonus()
@@ -289,6 +361,23 @@ class TestFilterPipeline:
         assert len(result) == 1
         assert result[0].uri == "at://2"
 
+    def test_account_limit_uses_counts_without_touching_state(self):
+        """Should count replies per account and leave the saved state JSON-only."""
+        pipeline = FilterPipeline()
+        pipeline.add_filter(AccountLimitFilter(max_per_session=2))
+
+        posts = [
+            Post(uri="at://1", cid="1", author_did="d1", author_handle="h1",
+                 text="test", created_at="x"),
+            Post(uri="at://2", cid="2", author_did="d2", author_handle="h2",
+                 text="test", created_at="x"),
+        ]
+        state = {"replied_posts": [], "replied_accounts_today": ["d1", "d1", "d2"]}
+        result = pipeline.process(posts, state)
+
+        assert [p.uri for p in result] == ["at://2"]
+        assert set(state) == {"replied_posts", "replied_accounts_today"}
+
     def test_multipliers_applied(self):
         """Should apply all multipliers to passing posts."""
         pipeline = FilterPipeline()
@@ -347,6 +436,22 @@ class TestFilterRecentPosts:
         assert len(result) == 1
         assert result[0].text == "recent"
 
+    def test_filters_offset_timestamps(self):
+        """Should compare non-UTC offsets by instant, not by string."""
+        tz = dt.timezone(dt.timedelta(hours=-8))
+        now = dt.datetime.now(tz)
+        recent = (now - dt.timedelta(hours=2)).isoformat()
+        old = (now - dt.timedelta(hours=24)).isoformat()
+
+        posts = [
+            {"post": {"uri": f"at://{i}", "cid": str(i), "author": {"did": "d", "handle": "h"},
+                      "record": {"text": text, "createdAt": created}}}
+            for i, (text, created) in enumerate([("recent", recent), ("old", old)])
+        ]
+
+        result = filter_recent_posts(posts, hours=12)
+        assert [p.text for p in result] == ["recent"]
+
     def test_handles_reply_metadata(self):
         """Should correctly parse reply metadata."""
         now = dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z")
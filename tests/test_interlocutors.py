@@ -20,11 +20,29 @@ from bsky_cli.interlocutors import (
 )
 
 
+@pytest.fixture(autouse=True)
+def memory_storage(request, monkeypatch):
+    """Back the store with a dict; tests that use temp_storage get the real JSON file."""
+    if "temp_storage" in request.fixturenames:
+        yield None
+        return
+    store: dict = {}
+
+    def write(raw):
+        store.clear()
+        store.update(raw)
+
+    monkeypatch.setattr(interlocutors, "_load_raw", lambda: store)
+    monkeypatch.setattr(interlocutors, "_write_raw", write)
+    yield store
+
+
 @pytest.fixture
 def temp_storage(tmp_path):
     """Use a temporary file for storage during tests."""
     test_file = tmp_path / "interlocutors.json"
-    with patch.object(interlocutors, 'INTERLOCUTORS_FILE', test_file):
+    with patch.object(interlocutors, 'INTERLOCUTORS_FILE', test_file), \
+            patch.object(interlocutors, '_cache', None):
         yield test_file
 
 
@@ -125,12 +143,28 @@ class TestInterlocutor:
         recent = inter.recent_interactions(3)
         assert len(recent) == 3
         assert recent[-1].date == "2026-02-10"
+        # Non-positive n behaves like the list slice [-n:]
+        assert len(inter.recent_interactions(0)) == 10
+        recent = inter.recent_interactions(-3)
+        assert [i.date for i in recent] == [f"2026-02-{d:02d}" for d in range(4, 11)]
+
+    def test_history_is_capped(self):
+        """Should keep only the newest MAX_INTERACTIONS_PER_USER entries."""
+        inter = Interlocutor.from_dict({"did": "x", "handle": "test", "interactions": []})
+        cap = interlocutors.MAX_INTERACTIONS_PER_USER
+        for i in range(cap + 5):
+            inter.add_interaction(Interaction(date=str(i), type="reply_to_them"))
+
+        assert inter.total_count == cap + 5
+        assert len(inter.interactions) == cap
+        assert inter.interactions[0].date == "5"
+        assert inter.to_dict()["interactions"][-1]["date"] == str(cap + 4)
 
 
 class TestRecordInteraction:
     """Tests for record_interaction function."""
 
-    def test_creates_new_interlocutor(self, temp_storage):
+    def test_creates_new_interlocutor(self):
         """Should create new interlocutor if not exists."""
         inter = record_interaction(
             did="did:plc:new",
@@ -142,14 +176,81 @@ class TestRecordInteraction:
         assert inter.handle == "new.bsky.social"
         assert inter.total_count == 1
 
-    def test_updates_existing_interlocutor(self, temp_storage):
+    def test_updates_existing_interlocutor(self):
         """Should update existing interlocutor."""
         record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
         inter = record_interaction(did="did:plc:test", handle="test", interaction_type="they_replied")
         
         assert inter.total_count == 2
 
-    def test_truncates_long_text(self, temp_storage):
+    def test_store_round_trips_through_json(self, temp_storage):
+        """Should persist a JSON store that reloads intact."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them", our_text="Hi")
+
+        raw = json.loads(temp_storage.read_text())
+        assert raw["did:plc:test"]["interactions"][0]["our_text"] == "Hi"
+        assert get_interlocutor("did:plc:test").total_count == 1
+
+    def test_reuses_parsed_store_until_file_changes(self, temp_storage):
+        """Should serve reads from memory and reload after an outside write."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        with patch.object(type(temp_storage), "read_text", side_effect=AssertionError("re-read")):
+            assert get_interlocutor("did:plc:test").total_count == 1
+
+        raw = json.loads(temp_storage.read_text())
+        raw["did:plc:test"]["handle"] = "renamed"
+        temp_storage.write_text(json.dumps(raw, indent=2))
+        assert get_interlocutor("did:plc:test").handle == "renamed"
+
+    def test_deleted_store_drops_cache(self, temp_storage):
+        """Should forget the cached store once the file is gone."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        temp_storage.unlink()
+
+        assert get_interlocutor("did:plc:test") is None
+        assert interlocutors._cache is None
+
+    def test_corrupt_store_drops_cache(self, temp_storage):
+        """Should forget the cached store once the file stops parsing."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        temp_storage.write_text("{not json")
+
+        assert get_interlocutor("did:plc:test") is None
+        assert interlocutors._cache is None
+
+    def test_get_by_handle_after_store_is_deleted(self, temp_storage):
+        """Should miss, not raise, once the store behind the index is gone."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        assert get_by_handle("test") is not None
+
+        temp_storage.unlink()
+        assert get_by_handle("test") is None
+
+    def test_get_by_handle_after_store_is_corrupted(self, temp_storage):
+        """Should miss, not raise, once the store behind the index is unreadable."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        assert get_by_handle("test") is not None
+
+        temp_storage.write_text("{not json")
+        assert get_by_handle("test") is None
+
+    def test_unsaved_edits_do_not_leak_into_cache(self, temp_storage):
+        """Should hand out copies, so in-place edits stay local until saved."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        get_interlocutor("did:plc:test").tags.append("friendly")
+
+        assert get_interlocutor("did:plc:test").tags == []
+
+    def test_failed_write_keeps_last_saved_state(self, temp_storage):
+        """Should not serve changes from the cache that never reached disk."""
+        record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
+        with patch.object(type(temp_storage), "write_text", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                record_interaction(did="did:plc:test", handle="test", interaction_type="they_replied")
+
+        assert get_interlocutor("did:plc:test").total_count == 1
+
+    def test_truncates_long_text(self):
         """Should truncate text over 200 chars."""
         long_text = "x" * 300
         inter = record_interaction(
@@ -165,7 +266,7 @@ class TestRecordInteraction:
 class TestGetters:
     """Tests for getter functions."""
 
-    def test_get_interlocutor(self, temp_storage):
+    def test_get_interlocutor(self):
         """Should retrieve by DID."""
         record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
         
@@ -175,7 +276,7 @@ class TestGetters:
         
         assert get_interlocutor("did:plc:nonexistent") is None
 
-    def test_get_by_handle(self, temp_storage):
+    def test_get_by_handle(self):
         """Should retrieve by handle."""
         record_interaction(did="did:plc:test", handle="Test.Bsky.Social", interaction_type="reply_to_them")
         
@@ -187,7 +288,16 @@ class TestGetters:
         inter = get_by_handle("@test.bsky.social")
         assert inter is not None
 
-    def test_is_regular_function(self, temp_storage):
+    def test_get_by_handle_follows_handle_change(self):
+        """Should find a user under a new handle after it is recorded."""
+        record_interaction(did="did:plc:test", handle="old.bsky.social", interaction_type="reply_to_them")
+        assert get_by_handle("old.bsky.social") is not None
+
+        record_interaction(did="did:plc:test", handle="New.bsky.social", interaction_type="they_replied")
+        assert get_by_handle("old.bsky.social") is None
+        assert get_by_handle("new.bsky.social").did == "did:plc:test"
+
+    def test_is_regular_function(self):
         """Should check regular status (10+ interactions by default)."""
         assert is_regular("did:plc:nonexistent") is False
         
@@ -201,12 +311,12 @@ class TestGetters:
 class TestFormatters:
     """Tests for formatting functions."""
 
-    def test_format_notification_badge_new(self, temp_storage):
+    def test_format_notification_badge_new(self):
         """Should return 🆕 for unknown users."""
         badge = format_notification_badge("did:plc:unknown")
         assert badge == "🆕"
 
-    def test_format_notification_badge_regular(self, temp_storage):
+    def test_format_notification_badge_regular(self):
         """Should return 🔄 for regulars (10+ interactions)."""
         for i in range(10):
             record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
@@ -214,14 +324,14 @@ class TestFormatters:
         badge = format_notification_badge("did:plc:test")
         assert badge == "🔄"
 
-    def test_format_notification_badge_known(self, temp_storage):
+    def test_format_notification_badge_known(self):
         """Should return empty for known non-regulars."""
         record_interaction(did="did:plc:test", handle="test", interaction_type="reply_to_them")
         
         badge = format_notification_badge("did:plc:test")
         assert badge == ""
 
-    def test_format_context_for_llm(self, temp_storage):
+    def test_format_context_for_llm(self):
         """Should format context string."""
         record_interaction(
             did="did:plc:test",
@@ -234,7 +344,7 @@ class TestFormatters:
         assert "@test.bsky.social" in context
         assert "Great post!" in context
 
-    def test_format_context_empty_for_unknown(self, temp_storage):
+    def test_format_context_empty_for_unknown(self):
         """Should return empty string for unknown users."""
         context = format_context_for_llm("did:plc:unknown")
         assert context == ""
@@ -1,52 +1,26 @@
 from bsky_cli import like
 
+PDS = "https://pds.example"
 
-class _Resp:
-    def __init__(self, status_code=200, json_data=None, text=""):
-        self.status_code = status_code
-        self._json_data = json_data or {}
-        self.text = text
 
-    def json(self):
-        return self._json_data
-
-
-def test_unlike_post_uses_viewer_like_record_when_available(monkeypatch):
-    calls = {"delete": None}
-
-    def fake_get(url, **kwargs):
-        if url.endswith("/xrpc/app.bsky.feed.getPosts"):
-            return _Resp(
-                200,
-                {
-                    "posts": [
-                        {
-                            "viewer": {
-                                "like": "at://did:plc:me/app.bsky.feed.like/3lxyzabc"
-                            }
-                        }
-                    ]
-                },
-            )
-        if url.endswith("/xrpc/app.bsky.feed.getLikes"):
-            return _Resp(200, {"likes": []})
-        raise AssertionError(f"Unexpected GET {url}")
-
-    def fake_post(url, **kwargs):
-        if url.endswith("/xrpc/com.atproto.repo.deleteRecord"):
-            calls["delete"] = kwargs.get("json")
-            return _Resp(200, {})
-        raise AssertionError(f"Unexpected POST {url}")
-
-    monkeypatch.setattr(like.requests, "get", fake_get)
-    monkeypatch.setattr(like.requests, "post", fake_post)
+def test_unlike_post_uses_viewer_like_record_when_available(requests_mock):
+    requests_mock.get(
+        f"{PDS}/xrpc/app.bsky.feed.getPosts",
+        json={"posts": [{"viewer": {"like": "at://did:plc:me/app.bsky.feed.like/3lxyzabc"}}]},
+    )
+    delete = requests_mock.post(f"{PDS}/xrpc/com.atproto.repo.deleteRecord", json={})
 
     ok = like.unlike_post(
-        "https://pds.example",
+        PDS,
         "jwt",
         "did:plc:me",
         "at://did:plc:author/app.bsky.feed.post/abc",
     )
 
     assert ok is True
-    assert calls["delete"]["rkey"] == "3lxyzabc"
+    assert delete.last_request.json()["rkey"] == "3lxyzabc"
+    # viewer.like was enough: no getLikes fallback scan
+    assert [r.path for r in requests_mock.request_history] == [
+        "/xrpc/app.bsky.feed.getposts",
+        "/xrpc/com.atproto.repo.deleterecord",
+    ]
@@ -1,38 +1,42 @@
 """Tests for lists module."""
 
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+import pytest
 
 from bsky_cli.lists import create_list, add_to_list, remove_from_list, delete_list, run
 
 
-@patch("bsky_cli.lists.requests.post")
-def test_create_list_success(mock_post):
-    mock_post.return_value = MagicMock(status_code=200, json=lambda: {"uri": "at://list/1"})
-    res = create_list("https://pds.test", "jwt", "did:plc:me", "AI Agents")
+PDS = "https://pds.test"
+
+
+@pytest.fixture
+def alice_handle(requests_mock):
+    """Resolve alice.bsky.social to did:plc:alice."""
+    requests_mock.get(f"{PDS}/xrpc/com.atproto.identity.resolveHandle", json={"did": "did:plc:alice"})
+    return requests_mock
+
+
+def test_create_list_success(requests_mock):
+    requests_mock.post(f"{PDS}/xrpc/com.atproto.repo.createRecord", json={"uri": "at://list/1"})
+    res = create_list(PDS, "jwt", "did:plc:me", "AI Agents")
     assert res is not None
     assert res["uri"] == "at://list/1"
 
 
-@patch("bsky_cli.lists.requests.post")
-@patch("bsky_cli.lists.resolve_handle")
-def test_add_to_list_resolves_handle(mock_resolve, mock_post):
-    mock_resolve.return_value = "did:plc:alice"
-    mock_post.return_value = MagicMock(status_code=200, json=lambda: {"uri": "at://listitem/1"})
-    res = add_to_list("https://pds.test", "jwt", "did:plc:me", "at://list/1", "alice.bsky.social")
+def test_add_to_list_resolves_handle(alice_handle):
+    create = alice_handle.post(f"{PDS}/xrpc/com.atproto.repo.createRecord", json={"uri": "at://listitem/1"})
+    res = add_to_list(PDS, "jwt", "did:plc:me", "at://list/1", "alice.bsky.social")
     assert res is not None
-    body = mock_post.call_args.kwargs["json"]
+    body = create.last_request.json()
     assert body["record"]["subject"] == "did:plc:alice"
 
 
-@patch("bsky_cli.lists.requests.post")
-@patch("bsky_cli.lists.requests.get")
-@patch("bsky_cli.lists.resolve_handle")
-def test_remove_from_list_deletes_matching_list_item(mock_resolve, mock_get, mock_post):
-    mock_resolve.return_value = "did:plc:alice"
-    mock_get.return_value = MagicMock(
-        status_code=200,
-        json=lambda: {
+def test_remove_from_list_deletes_matching_list_item(alice_handle):
+    alice_handle.get(
+        f"{PDS}/xrpc/app.bsky.graph.getList",
+        json={
             "items": [
                 {
                     "uri": "at://did:plc:me/app.bsky.graph.listitem/item123",
@@ -41,10 +45,10 @@ def test_remove_from_list_deletes_matching_list_item(mock_resolve, mock_get, moc
             ]
         },
     )
-    mock_post.return_value = MagicMock(status_code=200)
+    delete = alice_handle.post(f"{PDS}/xrpc/com.atproto.repo.deleteRecord", json={})
 
     ok = remove_from_list(
-        "https://pds.test",
+        PDS,
         "jwt",
         "did:plc:me",
         "at://did:plc:me/app.bsky.graph.list/list123",
@@ -52,25 +56,24 @@ def test_remove_from_list_deletes_matching_list_item(mock_resolve, mock_get, moc
     )
 
     assert ok is True
-    body = mock_post.call_args.kwargs["json"]
+    body = delete.last_request.json()
     assert body["repo"] == "did:plc:me"
     assert body["collection"] == "app.bsky.graph.listitem"
     assert body["rkey"] == "item123"
 
 
-@patch("bsky_cli.lists.requests.post")
-def test_delete_list_deletes_list_record(mock_post):
-    mock_post.return_value = MagicMock(status_code=200)
+def test_delete_list_deletes_list_record(requests_mock):
+    delete = requests_mock.post(f"{PDS}/xrpc/com.atproto.repo.deleteRecord", json={})
 
     ok = delete_list(
-        "https://pds.test",
+        PDS,
         "jwt",
         "did:plc:me",
         "at://did:plc:me/app.bsky.graph.list/list123",
     )
 
     assert ok is True
-    body = mock_post.call_args.kwargs["json"]
+    body = delete.last_request.json()
     assert body["repo"] == "did:plc:me"
     assert body["collection"] == "app.bsky.graph.list"
     assert body["rkey"] == "list123"
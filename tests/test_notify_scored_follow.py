@@ -1,3 +1,4 @@
+import bsky_cli.config as config_mod
 from bsky_cli import notify_scored
 
 
@@ -7,14 +8,17 @@ def test_relationship_follow_probability_thresholds():
     assert notify_scored._relationship_follow_probability(11) == 0.1
     assert notify_scored._relationship_follow_probability(50) == 0.1
     assert notify_scored._relationship_follow_probability(51) == 0.3
+    assert notify_scored._relationship_follow_probability(None) == 0.0
 
 
 def test_is_negative_tone_detects_negative_markers():
     assert notify_scored._is_negative_tone("hostile, conflict-heavy") is True
     assert notify_scored._is_negative_tone("friendly, technical") is False
+    assert notify_scored._is_negative_tone("Antagonistic at times") is True
+    assert notify_scored._is_negative_tone(None) is False
 
 
-def test_run_scored_can_follow_without_post_url(monkeypatch, capsys):
+def test_run_scored_can_follow_without_post_url(monkeypatch, capsys, notify_stub, notify_args):
     # Follow notifications don't have a post URL; we still want follow-back.
 
     follow_notif = {
@@ -25,12 +29,7 @@ def test_run_scored_can_follow_without_post_url(monkeypatch, capsys):
         "record": {"$type": "app.bsky.graph.follow"},
     }
 
-    # Patch notify module functions imported inside run_scored.
-    import bsky_cli.notify as notify_mod
-
-    monkeypatch.setattr(notify_mod, "get_notifications", lambda *a, **k: [follow_notif])
-    monkeypatch.setattr(notify_mod, "get_last_seen", lambda: None)
-    monkeypatch.setattr(notify_mod, "save_last_seen", lambda ts: None)
+    notify_stub.notifications = [follow_notif]
 
     # Strong profile so follow passes author_score threshold.
     monkeypatch.setattr(
@@ -51,24 +50,13 @@ def test_run_scored_can_follow_without_post_url(monkeypatch, capsys):
     monkeypatch.setattr(notify_scored, "follow_handle", lambda handle: calls.__setitem__("follow", calls["follow"] + 1) or 0)
     monkeypatch.setattr(notify_scored, "like_url", lambda url: 0)
 
-    class A:
-        all = False
-        json = False
-        score = False
-        execute = True
-        allow_replies = False
-        quiet = True
-        limit = 50
-        max_replies = 10
-        max_likes = 30
-        max_follows = 5
-
-    rc = notify_scored.run_scored(A(), "https://pds", "did:me", "jwt")
+    args = notify_args(execute=True, quiet=True, max_replies=10, max_likes=30, max_follows=5)
+    rc = notify_scored.run_scored(args, "https://pds", "did:me", "jwt")
     assert rc == 0
     assert calls["follow"] == 1
 
 
-def test_run_scored_relationship_follow_disabled_by_default(monkeypatch):
+def test_run_scored_relationship_follow_disabled_by_default(monkeypatch, notify_stub, notify_args):
     reply_notif = {
         "reason": "reply",
         "indexedAt": "2099-01-01T00:00:00.000Z",
@@ -77,11 +65,7 @@ def test_run_scored_relationship_follow_disabled_by_default(monkeypatch):
         "record": {"$type": "app.bsky.feed.post", "text": "replying to you"},
     }
 
-    import bsky_cli.notify as notify_mod
-
-    monkeypatch.setattr(notify_mod, "get_notifications", lambda *a, **k: [reply_notif])
-    monkeypatch.setattr(notify_mod, "get_last_seen", lambda: None)
-    monkeypatch.setattr(notify_mod, "save_last_seen", lambda ts: None)
+    notify_stub.notifications = [reply_notif]
 
     monkeypatch.setattr(
         notify_scored,
@@ -105,24 +89,13 @@ def test_run_scored_relationship_follow_disabled_by_default(monkeypatch):
     monkeypatch.setattr(notify_scored, "follow_handle", lambda handle: calls.__setitem__("follow", calls["follow"] + 1) or 0)
     monkeypatch.setattr(notify_scored, "like_url", lambda url: 0)
 
-    class A:
-        all = False
-        json = False
-        score = False
-        execute = True
-        allow_replies = False
-        quiet = True
-        limit = 50
-        max_replies = 10
-        max_likes = 30
-        max_follows = 5
-
-    rc = notify_scored.run_scored(A(), "https://pds", "did:me", "jwt")
+    args = notify_args(execute=True, quiet=True, max_replies=10, max_likes=30, max_follows=5)
+    rc = notify_scored.run_scored(args, "https://pds", "did:me", "jwt")
     assert rc == 0
     assert calls["follow"] == 0
 
 
-def test_run_scored_relationship_follow_for_reply(monkeypatch):
+def test_run_scored_relationship_follow_for_reply(monkeypatch, notify_stub, notify_args):
     reply_notif = {
         "reason": "reply",
         "indexedAt": "2099-01-01T00:00:00.000Z",
@@ -131,11 +104,7 @@ def test_run_scored_relationship_follow_for_reply(monkeypatch):
         "record": {"$type": "app.bsky.feed.post", "text": "replying to you"},
     }
 
-    import bsky_cli.notify as notify_mod
-
-    monkeypatch.setattr(notify_mod, "get_notifications", lambda *a, **k: [reply_notif])
-    monkeypatch.setattr(notify_mod, "get_last_seen", lambda: None)
-    monkeypatch.setattr(notify_mod, "save_last_seen", lambda ts: None)
+    notify_stub.notifications = [reply_notif]
 
     monkeypatch.setattr(
         notify_scored,
@@ -152,8 +121,6 @@ def test_run_scored_relationship_follow_for_reply(monkeypatch):
     )
 
     # Relationship >10, tone non-negative, maybe() true => follow should trigger
-    import bsky_cli.config as config_mod
-
     _orig_get = config_mod.get
     monkeypatch.setattr(
         config_mod,
@@ -168,18 +135,7 @@ def test_run_scored_relationship_follow_for_reply(monkeypatch):
     monkeypatch.setattr(notify_scored, "follow_handle", lambda handle: calls.__setitem__("follow", calls["follow"] + 1) or 0)
     monkeypatch.setattr(notify_scored, "like_url", lambda url: 0)
 
-    class A:
-        all = False
-        json = False
-        score = False
-        execute = True
-        allow_replies = False
-        quiet = True
-        limit = 50
-        max_replies = 10
-        max_likes = 30
-        max_follows = 5
-
-    rc = notify_scored.run_scored(A(), "https://pds", "did:me", "jwt")
+    args = notify_args(execute=True, quiet=True, max_replies=10, max_likes=30, max_follows=5)
+    rc = notify_scored.run_scored(args, "https://pds", "did:me", "jwt")
     assert rc == 0
     assert calls["follow"] == 1
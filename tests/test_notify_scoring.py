@@ -1,3 +1,5 @@
+import pytest
+
 from bsky_cli.notify_scoring import (
     score_author,
     is_probable_bot,
@@ -53,18 +55,18 @@ def test_score_notification_returns_0_100():
     assert 0 <= out["score"] <= 100
 
 
-def test_decide_actions_thresholds():
-    # >= 80 -> reply+like
-    acts = decide_actions({"score": 85, "question_clear": True})
-    assert acts["like"] is True and acts["reply"] is True
-
-    # 60..79 -> like, optional reply if question
-    acts = decide_actions({"score": 65, "question_clear": False})
-    assert acts["like"] is True and acts["reply"] is False
-
-    acts = decide_actions({"score": 65, "question_clear": True})
-    assert acts["like"] is True and acts["reply"] is True
-
-    # 40..59 -> like only if adds value
-    acts = decide_actions({"score": 50, "adds_value": False, "question_clear": True})
-    assert acts["like"] is False and acts["reply"] is False
+@pytest.mark.parametrize(
+    "state, like, reply",
+    [
+        # >= 80 -> reply+like
+        pytest.param({"score": 85, "question_clear": True}, True, True, id="80+"),
+        # 60..79 -> like, optional reply if question
+        pytest.param({"score": 65, "question_clear": False}, True, False, id="60-79-no-question"),
+        pytest.param({"score": 65, "question_clear": True}, True, True, id="60-79-question"),
+        # 40..59 -> like only if adds value
+        pytest.param({"score": 50, "adds_value": False, "question_clear": True}, False, False, id="40-59-no-value"),
+    ],
+)
+def test_decide_actions_thresholds(state, like, reply):
+    acts = decide_actions(state)
+    assert acts["like"] is like and acts["reply"] is reply
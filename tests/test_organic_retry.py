@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import json
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
 
 from bsky_cli import organic
 
 
 class _Resp:
+    __slots__ = ("status_code", "_payload")
+
     def __init__(self, status_code: int, payload: dict):
         self.status_code = status_code
         self._payload = payload
-        self.text = json.dumps(payload)
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self._payload)
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -19,108 +27,80 @@ class _Resp:
         return self._payload
 
 
-def _minimal_source():
-    return {"source_type": "sessions", "source_path": None, "topic": None, "requires_embed": False}
-
-
-def test_generate_post_with_llm_retries_on_429_then_succeeds(monkeypatch):
-    monkeypatch.setattr(organic, "load_from_pass", lambda _p: {"OPENROUTER_API_KEY": "k"})
-    monkeypatch.setattr(organic, "get", lambda *_a, **_k: 2)
-
-    calls = {"n": 0}
-
-    def _post(*args, **kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return _Resp(429, {"error": "rate limited"})
-        return _Resp(200, {"choices": [{"message": {"content": '{"text":"hello"}'}}]})
-
-    monkeypatch.setattr(organic.requests, "post", _post)
-    monkeypatch.setattr(organic, "sleep", lambda _s: None)
-
-    out = organic.generate_post_with_llm("activités", _minimal_source(), "guidelines")
-
-    assert out == {"text": "hello"}
-    assert calls["n"] == 2
-
-
-def test_generate_post_with_llm_returns_none_after_429_retries(monkeypatch):
-    monkeypatch.setattr(organic, "load_from_pass", lambda _p: {"OPENROUTER_API_KEY": "k"})
-    monkeypatch.setattr(organic, "get", lambda *_a, **_k: 2)
-
-    calls = {"n": 0}
-
-    def _post(*args, **kwargs):
-        calls["n"] += 1
-        return _Resp(429, {"error": "rate limited"})
-
-    monkeypatch.setattr(organic.requests, "post", _post)
-    monkeypatch.setattr(organic, "sleep", lambda _s: None)
-
-    out = organic.generate_post_with_llm("activités", _minimal_source(), "guidelines")
-
-    assert out is None
-    assert calls["n"] == 3
-
-
-def test_generate_post_with_llm_no_retry_on_permanent_error(monkeypatch):
-    """Permanent errors like 401/400 should NOT be retried (PR #17 review fix)."""
-    monkeypatch.setattr(organic, "load_from_pass", lambda _p: {"OPENROUTER_API_KEY": "k"})
-    monkeypatch.setattr(organic, "get", lambda *_a, **_k: 2)
-
-    calls = {"n": 0}
+# Read-only: a sessions source is never mutated by generate_post_with_llm.
+_MIN_SOURCE = MappingProxyType(
+    {"source_type": "sessions", "source_path": None, "topic": None, "requires_embed": False}
+)
 
-    def _post(*args, **kwargs):
-        calls["n"] += 1
-        return _Resp(401, {"error": "unauthorized"})
 
-    monkeypatch.setattr(organic.requests, "post", _post)
-    monkeypatch.setattr(organic, "sleep", lambda _s: None)
+def _llm_reply(content: str) -> tuple[int, dict]:
+    return 200, {"choices": [{"message": {"content": content}}]}
 
-    out = organic.generate_post_with_llm("activités", _minimal_source(), "guidelines")
 
-    assert out is None
-    # Should fail on first attempt without retrying
-    assert calls["n"] == 1, "Permanent errors must not trigger retries"
+_RATE_LIMITED = (429, {"error": "rate limited"})
+_PASS_ENV = {"OPENROUTER_API_KEY": "k"}
 
 
-def test_generate_post_with_llm_retries_on_connection_error(monkeypatch):
-    """Transient network errors should be retried."""
-    monkeypatch.setattr(organic, "load_from_pass", lambda _p: {"OPENROUTER_API_KEY": "k"})
-    monkeypatch.setattr(organic, "get", lambda *_a, **_k: 2)
+def _fake_load_from_pass(_path):
+    return _PASS_ENV
 
-    calls = {"n": 0}
 
-    def _post(*args, **kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            raise organic.requests.ConnectionError("connection reset")
-        return _Resp(200, {"choices": [{"message": {"content": '{"text":"recovered"}'}}]})
+def _fake_get(*_args, **_kwargs):
+    # Every numeric config lookup (max_retries, backoff) reads as 2
+    return 2
 
-    monkeypatch.setattr(organic.requests, "post", _post)
-    monkeypatch.setattr(organic, "sleep", lambda _s: None)
 
-    out = organic.generate_post_with_llm("activités", _minimal_source(), "guidelines")
+@pytest.fixture
+def llm_post(monkeypatch):
+    """Script organic's OpenRouter POSTs: llm_post(step, ...) -> call/sleep record.
 
-    assert out == {"text": "recovered"}
-    assert calls["n"] == 2
+    Each step is a (status, payload) tuple or an exception to raise; the last
+    step repeats once the script runs out. Config gives max_retries=2.
+    Backoff waits are recorded on top of the autouse no-sleep patch.
+    """
+    monkeypatch.setattr(organic, "load_from_pass", _fake_load_from_pass)
+    monkeypatch.setattr(organic, "get", _fake_get)
+    record = SimpleNamespace(n=0, sleeps=[])
+    monkeypatch.setattr(organic, "sleep", record.sleeps.append)
 
+    def script(*steps):
+        def _post(*args, **kwargs):
+            step = steps[min(record.n, len(steps) - 1)]
+            record.n += 1
+            if isinstance(step, Exception):
+                raise step
+            return _Resp(*step)
 
-def test_generate_post_with_llm_no_retry_on_json_parse_error(monkeypatch):
-    """JSON parse errors (malformed LLM output) should NOT be retried."""
-    monkeypatch.setattr(organic, "load_from_pass", lambda _p: {"OPENROUTER_API_KEY": "k"})
-    monkeypatch.setattr(organic, "get", lambda *_a, **_k: 2)
+        monkeypatch.setattr(organic.requests, "post", _post)
+        return record
 
-    calls = {"n": 0}
+    return script
 
-    def _post(*args, **kwargs):
-        calls["n"] += 1
-        return _Resp(200, {"choices": [{"message": {"content": "not valid json at all"}}]})
 
-    monkeypatch.setattr(organic.requests, "post", _post)
-    monkeypatch.setattr(organic, "sleep", lambda _s: None)
+@pytest.mark.parametrize(
+    "steps, expected_out, expected_calls",
+    [
+        pytest.param((_RATE_LIMITED, _llm_reply('{"text":"hello"}')), {"text": "hello"}, 2, id="429-then-ok"),
+        pytest.param((_RATE_LIMITED,), None, 3, id="429-exhausted"),
+        # Permanent errors like 401/400 should NOT be retried (PR #17 review fix)
+        pytest.param(((401, {"error": "unauthorized"}),), None, 1, id="permanent-401"),
+        # Transient network errors are retried
+        pytest.param(
+            (organic.requests.ConnectionError("connection reset"), _llm_reply('{"text":"recovered"}')),
+            {"text": "recovered"},
+            2,
+            id="connection-error-then-ok",
+        ),
+        # Malformed LLM output is not a transient failure
+        pytest.param((_llm_reply("not valid json at all"),), None, 1, id="bad-json"),
+    ],
+)
+def test_generate_post_with_llm_retry_policy(llm_post, steps, expected_out, expected_calls):
+    record = llm_post(*steps)
 
-    out = organic.generate_post_with_llm("activités", _minimal_source(), "guidelines")
+    out = organic.generate_post_with_llm("activités", _MIN_SOURCE, "guidelines")
 
-    assert out is None
-    assert calls["n"] == 1, "JSON parse errors must not trigger retries"
+    assert out == expected_out
+    assert record.n == expected_calls
+    # One backoff sleep between consecutive attempts, none after the last
+    assert len(record.sleeps) == expected_calls - 1
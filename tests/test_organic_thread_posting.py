@@ -1,22 +1,37 @@
+from unittest.mock import patch
+
 from bsky_cli import organic
 
+_SESSIONS_SOURCE = {"source_type": "sessions", "source_path": None, "topic": None, "requires_embed": False}
+# Force a 2-post thread from LLM
+_TWO_POST_THREAD = {"posts": [{"text": "a" * 120}, {"text": "b" * 140 + " #AI"}], "embed_url": None, "reason": ""}
 
-def test_thread_segments_skip_antirepeat(monkeypatch):
-    # Force a 2-post thread from LLM
 
-    monkeypatch.setattr(organic, "load_guidelines", lambda: "")
-    monkeypatch.setattr(organic, "select_content_type", lambda: "passions")
-    monkeypatch.setattr(organic, "get_source_for_type", lambda ct: {"source_type": "sessions", "source_path": None, "topic": None, "requires_embed": False})
+def _no_guidelines():
+    return ""
 
-    monkeypatch.setattr(
-        organic,
-        "generate_post_with_llm",
-        lambda *a, **k: {"posts": [{"text": "a" * 120}, {"text": "b" * 140 + " #AI"}], "embed_url": None, "reason": ""},
-    )
 
-    monkeypatch.setattr(organic, "get_session", lambda: ("https://pds", "did:me", "jwt", "me.bsky.social"))
-    monkeypatch.setattr(organic, "create_external_embed", lambda *a, **k: None)
+def _passions():
+    return "passions"
+
+
+def _sessions_source(_content_type):
+    return _SESSIONS_SOURCE
+
+
+def _two_post_thread(*_args, **_kwargs):
+    return _TWO_POST_THREAD
+
 
+def _session():
+    return ("https://pds", "did:me", "jwt", "me.bsky.social")
+
+
+def _no_embed(*_args, **_kwargs):
+    return None
+
+
+def test_thread_segments_skip_antirepeat():
     seen = []
 
     def fake_create_post(pds, jwt, did, text, *, allow_repeat=False, **kwargs):
@@ -24,15 +39,24 @@ def test_thread_segments_skip_antirepeat(monkeypatch):
         # minimal response
         return {"uri": "at://x/app.bsky.feed.post/1", "cid": "cid"}
 
-    monkeypatch.setattr(organic, "create_post", fake_create_post)
-
     class Args:
         probability = 1.0
         dry_run = False
         force = True
         max_posts = 3
 
-    rc = organic.run(Args())
+    with patch.multiple(
+        organic,
+        load_guidelines=_no_guidelines,
+        select_content_type=_passions,
+        get_source_for_type=_sessions_source,
+        generate_post_with_llm=_two_post_thread,
+        get_session=_session,
+        create_external_embed=_no_embed,
+        create_post=fake_create_post,
+    ):
+        rc = organic.run(Args())
+
     assert rc == 0
     # First post: allow_repeat False, subsequent: True
     assert seen == [False, True]
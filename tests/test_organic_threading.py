@@ -2,6 +2,10 @@ import pytest
 
 from bsky_cli import organic
 
+# Shared fixtures for the length-limit tests; one object per module.
+_LONG_WORDS = ("word " * 400).strip() + " #AI #Linux"
+_NEAR_LIMIT_POST = "a" * 270
+
 
 def test_split_text_to_thread_keeps_hashtags_only_in_last_post():
     text = (
@@ -20,26 +24,25 @@ def test_split_text_to_thread_keeps_hashtags_only_in_last_post():
 
 
 def test_split_text_to_thread_never_exceeds_280_chars():
-    base = "word " * 400
-    text = base.strip() + " #AI #Linux"
-    posts = organic.split_text_to_thread(text, max_posts=3)
+    posts = organic.split_text_to_thread(_LONG_WORDS, max_posts=3)
     assert 1 <= len(posts) <= 3
     assert all(len(p) <= 280 for p in posts)
 
 
-def test_validate_thread_posts_rejects_too_imbalanced():
-    # Extremely imbalanced: last post is tiny.
-    posts = ["a" * 270, "b" * 5]
-    assert organic.validate_thread_posts(posts, max_posts=3) is False
-
-
-def test_validate_thread_posts_accepts_reasonable_balance():
-    posts = ["a" * 180, "b" * 180]
-    assert organic.validate_thread_posts(posts, max_posts=3) is True
+@pytest.mark.parametrize(
+    "posts, ok",
+    [
+        # Extremely imbalanced: last post is tiny.
+        pytest.param([_NEAR_LIMIT_POST, "b" * 5], False, id="rejects-too-imbalanced"),
+        pytest.param(["a" * 180, "b" * 180], True, id="accepts-reasonable-balance"),
+    ],
+)
+def test_validate_thread_posts_balance(posts, ok):
+    assert organic.validate_thread_posts(posts, max_posts=3) is ok
 
 
 def test_apply_thread_prefixes_adds_numbering_and_respects_limits():
-    posts = ["a" * 270, "b" * 200]
+    posts = [_NEAR_LIMIT_POST, "b" * 200]
     out = organic.apply_thread_prefixes(posts, max_chars=280)
     assert out[0].startswith("(1/2) ")
     assert out[1].startswith("(2/2) ")
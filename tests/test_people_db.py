@@ -1,27 +1,23 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 from types import SimpleNamespace
 
+import pytest
 
-def _mk_conn():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    return conn
+# people.run reads columns by name
+pytestmark = pytest.mark.rows_by_name
 
 
-def test_people_stats_uses_sqlite(monkeypatch, capsys):
+def test_people_stats_uses_sqlite(monkeypatch, capsys, fresh_db):
     """PR-006: bsky people should read stats from the per-account SQLite DB (not interlocutors.json)."""
 
     from bsky_cli import people
 
-    conn = _mk_conn()
+    conn = fresh_db
 
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
-    people.ensure_schema(conn)
-
     conn.execute(
         "INSERT INTO actors(did, handle, display_name, first_seen, last_interaction, total_count, notes_manual) VALUES (?,?,?,?,?,?,?)",
         ("did:plc:alice", "alice.bsky.social", "Alice", "2026-02-01", "2026-02-10", 0, ""),
@@ -63,17 +59,15 @@ def test_people_stats_uses_sqlite(monkeypatch, capsys):
     assert "1" in out
 
 
-def test_people_can_set_note_and_tags_in_db(monkeypatch, capsys):
+def test_people_can_set_note_and_tags_in_db(monkeypatch, capsys, fresh_db):
     """PR-006: allow setting manual notes/tags in SQLite via bsky people."""
 
     from bsky_cli import people
 
-    conn = _mk_conn()
+    conn = fresh_db
 
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
-    people.ensure_schema(conn)
-
     conn.execute(
         "INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)",
         ("did:plc:alice", "alice.bsky.social", "Alice"),
@@ -103,13 +97,11 @@ def test_people_can_set_note_and_tags_in_db(monkeypatch, capsys):
     assert "ai" in tags
 
 
-def test_people_list_json_outputs_machine_readable_payload(monkeypatch, capsys):
+def test_people_list_json_outputs_machine_readable_payload(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
-    people.ensure_schema(conn)
-
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
     conn.execute(
         "INSERT INTO interactions(actor_did, date, type, post_uri, our_text, their_text) VALUES (?,?,?,?,?,?)",
@@ -1,22 +1,18 @@
 from __future__ import annotations
 
-import sqlite3
 from datetime import datetime, timezone, timedelta
 from types import SimpleNamespace
 
+import pytest
 
-def _mk_conn():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    return conn
+# people.run reads columns by name
+pytestmark = pytest.mark.rows_by_name
 
 
-def test_people_enrich_skips_when_recent(monkeypatch, capsys):
+def test_people_enrich_skips_when_recent(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
-
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
@@ -61,12 +57,10 @@ def test_people_enrich_skips_when_recent(monkeypatch, capsys):
     assert "enrich skipped" in out
 
 
-def test_people_enrich_min_age_hours_zero_disables_cooldown(monkeypatch, capsys):
+def test_people_enrich_min_age_hours_zero_disables_cooldown(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
-
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
@@ -112,12 +106,10 @@ def test_people_enrich_min_age_hours_zero_disables_cooldown(monkeypatch, capsys)
     assert called["n"] == 1
 
 
-def test_people_enrich_cooldown_applies_across_kinds(monkeypatch, capsys):
+def test_people_enrich_cooldown_applies_across_kinds(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
-
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
@@ -153,12 +145,10 @@ def test_people_enrich_cooldown_applies_across_kinds(monkeypatch, capsys):
     assert "enrich skipped" in out
 
 
-def test_people_enrich_execute_saves_snapshots(monkeypatch, capsys):
+def test_people_enrich_execute_saves_snapshots(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
-
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
@@ -218,11 +208,10 @@ def test_people_enrich_execute_saves_snapshots(monkeypatch, capsys):
     assert kinds == ["interests", "notes", "tone"]
 
 
-def test_people_enrich_list_mode_supports_max_dry_run(monkeypatch, capsys):
+def test_people_enrich_list_mode_supports_max_dry_run(monkeypatch, capsys, fresh_db):
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
+    conn = fresh_db
     monkeypatch.setattr(people, "_open_default_db", lambda: (conn, "echo.0mg.cc"))
 
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
@@ -1,23 +1,19 @@
 from __future__ import annotations
 
-import sqlite3
 from types import SimpleNamespace
 
+import pytest
 
-def _mk_conn():
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    return conn
+# people.run reads columns by name
+pytestmark = pytest.mark.rows_by_name
 
 
-def test_people_last_activity_uses_newest_of_dm_and_interactions(monkeypatch, capsys):
+def test_people_last_activity_uses_newest_of_dm_and_interactions(monkeypatch, capsys, fresh_db):
     """Regression test for Codex inline comment: last activity must be newest of DM vs interactions."""
 
     from bsky_cli import people
 
-    conn = _mk_conn()
-    people.ensure_schema(conn)
-
+    conn = fresh_db
     conn.execute("INSERT INTO actors(did, handle, display_name) VALUES (?,?,?)", ("did:plc:alice", "alice.bsky.social", "Alice"))
 
     # Old DM
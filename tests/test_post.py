@@ -1,6 +1,6 @@
 """Tests for post module."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from bsky_cli import post as post_mod
 from bsky_cli.post import (
@@ -11,6 +11,20 @@ from bsky_cli.post import (
 )
 
 
+class _Resp:
+    """Minimal successful requests.Response stand-in."""
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
 class TestDetectFacets:
     """Tests for detect_facets function."""
 
@@ -58,15 +72,10 @@ class TestResolvePost:
 
     def test_resolves_post_url_with_handle(self):
         """Should resolve post URL with handle."""
-        mock_handle_response = MagicMock()
-        mock_handle_response.json.return_value = {"did": "did:plc:test123"}
+        mock_handle_response = _Resp({"did": "did:plc:test123"})
+        mock_posts_response = _Resp({"posts": [{"cid": "cid123"}]})
         
-        mock_posts_response = MagicMock()
-        mock_posts_response.json.return_value = {
-            "posts": [{"cid": "cid123"}]
-        }
-        
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = [mock_handle_response, mock_posts_response]
             result = resolve_post(
                 "https://bsky.social", "jwt",
@@ -78,14 +87,25 @@ class TestResolvePost:
         assert uri == "at://did:plc:test123/app.bsky.feed.post/abc123"
         assert cid == "cid123"
 
+    def test_reuses_resolved_handle(self):
+        """Should resolve a handle once across post URLs on the same PDS."""
+        mock_handle_response = _Resp({"did": "did:plc:test123"})
+        mock_posts_response = _Resp({"posts": [{"cid": "cid123"}]})
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = [mock_handle_response, mock_posts_response, mock_posts_response]
+            first = resolve_post("https://bsky.social", "jwt", "https://bsky.app/profile/test.bsky.social/post/abc123")
+            second = resolve_post("https://bsky.social", "jwt", "https://bsky.app/profile/test.bsky.social/post/def456")
+
+        assert first[0] == "at://did:plc:test123/app.bsky.feed.post/abc123"
+        assert second[0] == "at://did:plc:test123/app.bsky.feed.post/def456"
+        assert mock_get.call_count == 3
+
     def test_resolves_post_url_with_did(self):
         """Should resolve post URL with DID (no handle resolution needed)."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "posts": [{"cid": "cid456"}]
-        }
+        mock_response = _Resp({"posts": [{"cid": "cid456"}]})
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             result = resolve_post(
                 "https://bsky.social", "jwt",
@@ -24,3 +24,39 @@ def test_detect_facets_strips_trailing_dot_for_mentions(monkeypatch):
     byte_end = mention["index"]["byteEnd"]
 
     assert text.encode("utf-8")[byte_start:byte_end].decode("utf-8") == "@alice.bsky.social"
+
+
+def test_detect_facets_resolves_each_handle_once(monkeypatch):
+    import bsky_cli.auth as auth
+
+    calls = []
+
+    def _resolve(pds: str, handle: str) -> str:
+        calls.append(handle)
+        return "did:plc:alice"
+
+    monkeypatch.setattr(auth, "resolve_handle", _resolve)
+
+    first = detect_facets("cc @alice.bsky.social and @alice.bsky.social", pds="https://pds.invalid")
+    second = detect_facets("thanks @alice.bsky.social!", pds="https://pds.invalid")
+
+    assert len(first) == 2 and len(second) == 1
+    assert calls == ["alice.bsky.social"]
+
+
+def test_detect_facets_resolves_distinct_handles_and_skips_failures(monkeypatch):
+    import bsky_cli.auth as auth
+
+    dids = {"alice.bsky.social": "did:plc:alice", "bob.bsky.social": "did:plc:bob"}
+
+    def _resolve(pds: str, handle: str) -> str:
+        return dids[handle]  # KeyError for unknown handles
+
+    monkeypatch.setattr(auth, "resolve_handle", _resolve)
+
+    text = "@alice.bsky.social @ghost.bsky.social @bob.bsky.social"
+    facets = detect_facets(text, pds="https://pds.invalid")
+
+    assert [f["features"][0]["did"] for f in facets] == ["did:plc:alice", "did:plc:bob"]
+    spans = [text.encode("utf-8")[f["index"]["byteStart"]:f["index"]["byteEnd"]].decode("utf-8") for f in facets]
+    assert spans == ["@alice.bsky.social", "@bob.bsky.social"]
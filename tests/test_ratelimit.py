@@ -9,7 +9,7 @@ from bsky_cli import http
 def test_rate_limiter_waits_when_limit_reached():
     limiter = RateLimiter(calls_per_minute=2)
 
-    with patch("bsky_cli.ratelimit.time.time", side_effect=[0.0, 0.1, 0.2, 0.2, 60.1]), patch(
+    with patch("bsky_cli.ratelimit.time.monotonic", side_effect=[0.0, 0.1, 0.2, 0.2, 60.1]), patch(
         "bsky_cli.ratelimit.time.sleep"
     ) as mock_sleep:
         limiter.wait_if_needed()
@@ -21,8 +21,24 @@ def test_rate_limiter_waits_when_limit_reached():
     assert mock_sleep.call_args_list[0].args[0] > 59
 
 
-@patch("bsky_cli.http._requests.get")
+@patch("bsky_cli.http._requests.Session.get")
 def test_http_wrapper_calls_underlying_requests(mock_get):
     http._limiter = RateLimiter(calls_per_minute=100)
     http.requests.get("https://example.com", timeout=1)
     mock_get.assert_called_once()
+
+
+def test_http_wrapper_reuses_one_session():
+    assert http.get_http_session() is http.get_http_session()
+
+
+def test_http_singletons_are_shared_across_threads(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(http, "_limiter", None)
+    monkeypatch.setattr(http, "_session", None)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        limiters = set(map(id, pool.map(lambda _i: http.get_limiter(), range(16))))
+        sessions = set(map(id, pool.map(lambda _i: http.get_http_session(), range(16))))
+
+    assert len(limiters) == 1 and len(sessions) == 1
@@ -1,20 +1,30 @@
 """Tests for repost module."""
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from bsky_cli.repost import repost, unrepost
 
 
+class _Resp:
+    """Minimal stand-in for a requests.Response."""
+    __slots__ = ("status_code", "_payload", "text")
+
+    def __init__(self, status_code: int = 200, payload: dict | None = None, text: str = ""):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+
 class TestRepost:
     """Tests for repost function."""
     
     @patch('bsky_cli.repost.requests.post')
     def test_repost_success(self, mock_post):
         """Test successful repost."""
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"uri": "at://did:plc:test/app.bsky.feed.repost/abc123"}
-        )
+        mock_post.return_value = _Resp(200, {"uri": "at://did:plc:test/app.bsky.feed.repost/abc123"})
         
         result = repost(
             "https://pds.test",
@@ -38,10 +48,7 @@ class TestRepost:
     @patch('bsky_cli.repost.requests.post')
     def test_repost_failure(self, mock_post):
         """Test failed repost returns None."""
-        mock_post.return_value = MagicMock(
-            status_code=400,
-            text="Bad request"
-        )
+        mock_post.return_value = _Resp(400, text="Bad request")
         
         result = repost(
             "https://pds.test",
@@ -64,15 +71,10 @@ class TestUnrepost:
         # First call: getRepostedBy
         # Second call: listRecords
         mock_get.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=lambda: {
-                    "repostedBy": [{"did": "did:plc:myid"}]
-                }
-            ),
-            MagicMock(
-                status_code=200,
-                json=lambda: {
+            _Resp(200, {"repostedBy": [{"did": "did:plc:myid"}]}),
+            _Resp(
+                200,
+                {
                     "records": [
                         {
                             "uri": "at://did:plc:myid/app.bsky.feed.repost/repostkey123",
@@ -88,7 +90,7 @@ class TestUnrepost:
         ]
         
         # Mock deleteRecord response
-        mock_post.return_value = MagicMock(status_code=200)
+        mock_post.return_value = _Resp(200)
         
         result = unrepost(
             "https://pds.test",
@@ -104,13 +106,34 @@ class TestUnrepost:
         json_data = call_args.kwargs.get("json") or call_args[1].get("json")
         assert json_data["rkey"] == "repostkey123"
     
+    @patch('bsky_cli.repost.requests.post')
+    @patch('bsky_cli.repost.requests.get')
+    def test_unrepost_pages_until_record_found(self, mock_get, mock_post):
+        """Test unrepost follows listRecords cursors and stops at the match."""
+        target = "at://did:plc:other/app.bsky.feed.post/xyz"
+        mock_get.side_effect = [
+            _Resp(200, {"repostedBy": [{"did": "did:plc:myid"}]}),
+            _Resp(200, {
+                "records": [{"uri": "at://did:plc:myid/app.bsky.feed.repost/k1", "value": {"subject": {"uri": "at://x/p/other"}}}],
+                "cursor": "page2",
+            }),
+            _Resp(200, {
+                "records": [{"uri": "at://did:plc:myid/app.bsky.feed.repost/k2", "value": {"subject": {"uri": target}}}],
+                "cursor": "page3",
+            }),
+        ]
+        mock_post.return_value = _Resp(200)
+
+        assert unrepost("https://pds.test", "jwt-token", "did:plc:myid", target) is True
+
+        assert mock_get.call_count == 3
+        assert mock_get.call_args.kwargs["params"]["cursor"] == "page2"
+        assert mock_post.call_args.kwargs["json"]["rkey"] == "k2"
+
     @patch('bsky_cli.repost.requests.get')
     def test_unrepost_not_reposted(self, mock_get):
         """Test unrepost when post wasn't reposted."""
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"repostedBy": []}  # We're not in the list
-        )
+        mock_get.return_value = _Resp(200, {"repostedBy": []})  # We're not in the list
         
         result = unrepost(
             "https://pds.test",
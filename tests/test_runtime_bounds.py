@@ -1,9 +1,36 @@
+from dataclasses import dataclass
 from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from bsky_cli import engage, appreciate, discover
 
 
+@dataclass(frozen=True, slots=True)
+class EngageArgs:
+    """`bsky engage` args read by engage.run."""
+    dry_run: bool = True
+    hours: int = 12
+    max_runtime_seconds: int | None = 30
+
+
+@dataclass(frozen=True, slots=True)
+class AppreciateArgs:
+    """`bsky appreciate` args read by appreciate.run."""
+    dry_run: bool = True
+    hours: int = 12
+    max: int = 5
+    max_runtime_seconds: int | None = 30
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoverArgs:
+    """`bsky discover` args read by discover.run."""
+    mode: str = "follows"
+    dry_run: bool = True
+    max: int = 10
+    max_runtime_seconds: int | None = 30
+
+
 def _fake_session():
     return ("https://pds.example", "did:plc:me", "jwt", "me.bsky.social")
 
@@ -13,7 +40,7 @@ def test_engage_respects_max_runtime_seconds(monkeypatch, capsys):
     monkeypatch.setattr(engage, "load_state", lambda: {"replied_posts": [], "replied_accounts_today": []})
     monkeypatch.setattr(engage, "load_conversations", lambda: {})
 
-    rc = engage.run(SimpleNamespace(dry_run=True, hours=12, max_runtime_seconds=0))
+    rc = engage.run(EngageArgs(dry_run=True, max_runtime_seconds=0))
 
     assert rc != 0
     out = capsys.readouterr().out
@@ -25,7 +52,7 @@ def test_appreciate_respects_max_runtime_seconds(monkeypatch, capsys):
     monkeypatch.setattr(appreciate, "get_session", _fake_session)
     monkeypatch.setattr(appreciate, "load_state", lambda: {"liked_posts": [], "quoted_posts": []})
 
-    rc = appreciate.run(SimpleNamespace(dry_run=True, hours=12, max=5, max_runtime_seconds=0))
+    rc = appreciate.run(AppreciateArgs(dry_run=True, max_runtime_seconds=0))
 
     assert rc != 0
     out = capsys.readouterr().out
@@ -37,7 +64,7 @@ def test_discover_respects_max_runtime_seconds(monkeypatch, capsys):
     monkeypatch.setattr(discover, "get_session", _fake_session)
     monkeypatch.setattr(discover, "load_state", lambda: {})
 
-    rc = discover.run(SimpleNamespace(mode="follows", dry_run=True, max=10, max_runtime_seconds=0))
+    rc = discover.run(DiscoverArgs(mode="follows", dry_run=True, max_runtime_seconds=0))
 
     assert rc != 0
     out = capsys.readouterr().out
@@ -53,7 +80,7 @@ def test_engage_prints_phase_progression(monkeypatch, capsys):
     monkeypatch.setattr(engage, "get_follows", lambda pds, jwt, did, **_kw: [])
     monkeypatch.setattr(engage, "get_replies_to_our_posts", lambda *a, **k: [])
 
-    rc = engage.run(SimpleNamespace(dry_run=True, hours=12, max_runtime_seconds=30))
+    rc = engage.run(EngageArgs(dry_run=True, max_runtime_seconds=30))
 
     assert rc == 0
     out = capsys.readouterr().out
@@ -86,7 +113,7 @@ def test_discover_times_out_during_mode_execution(monkeypatch, capsys):
     )
     monkeypatch.setattr(discover.random, "sample", lambda seq, n: list(seq)[:n])
 
-    rc = discover.run(SimpleNamespace(mode="follows", dry_run=True, max=10, max_runtime_seconds=30))
+    rc = discover.run(DiscoverArgs(mode="follows", dry_run=True, max_runtime_seconds=30))
 
     assert rc == discover.TIMEOUT_EXIT_CODE
     out = capsys.readouterr().out
@@ -160,7 +187,7 @@ def test_engage_saves_state_on_act_timeout(monkeypatch, capsys):
     monkeypatch.setattr(engage, "save_conversations", fake_save_conversations)
     monkeypatch.setattr(engage, "RuntimeGuard", _PhaseTimeoutGuard)
 
-    rc = engage.run(SimpleNamespace(dry_run=False, hours=12, max_runtime_seconds=30))
+    rc = engage.run(EngageArgs(dry_run=False, max_runtime_seconds=30))
 
     assert rc == engage.TIMEOUT_EXIT_CODE
     assert saved["state"], "engage must save state on timeout"
@@ -195,7 +222,7 @@ def test_appreciate_saves_state_on_act_timeout(monkeypatch, capsys):
     monkeypatch.setattr(appreciate, "save_state", fake_save_state)
     monkeypatch.setattr(appreciate, "RuntimeGuard", _PhaseTimeoutGuard)
 
-    rc = appreciate.run(SimpleNamespace(dry_run=False, hours=12, max=5, max_runtime_seconds=30))
+    rc = appreciate.run(AppreciateArgs(dry_run=False, max_runtime_seconds=30))
 
     assert rc == appreciate.TIMEOUT_EXIT_CODE
     assert saved["state"], "appreciate must save state on timeout"
@@ -241,7 +268,7 @@ def test_discover_saves_state_on_timeout(monkeypatch, capsys):
     monkeypatch.setattr(discover.random, "sample", lambda seq, n: list(seq)[:n])
     monkeypatch.setattr(discover, "save_state", fake_save_state)
 
-    rc = discover.run(SimpleNamespace(mode="follows", dry_run=False, max=10, max_runtime_seconds=30))
+    rc = discover.run(DiscoverArgs(mode="follows", dry_run=False, max_runtime_seconds=30))
 
     assert rc == discover.TIMEOUT_EXIT_CODE
     assert saved["state"], "discover must save state on timeout"
@@ -336,7 +363,7 @@ def test_engage_collect_timeout_during_get_follows_pagination(monkeypatch, capsy
 
     monkeypatch.setattr(engage.requests, "get", fake_get)
 
-    rc = engage.run(SimpleNamespace(dry_run=True, hours=12, max_runtime_seconds=30))
+    rc = engage.run(EngageArgs(dry_run=True, max_runtime_seconds=30))
 
     assert rc == engage.TIMEOUT_EXIT_CODE
     out = capsys.readouterr().out
@@ -399,7 +426,7 @@ def test_discover_reposts_flushes_state_before_timeout(monkeypatch, capsys):
     monkeypatch.setattr(discover.random, "sample", lambda seq, n: list(seq)[:n])
     monkeypatch.setattr(discover, "save_state", fake_save_state)
 
-    rc = discover.run(SimpleNamespace(mode="reposts", dry_run=False, max=10, max_runtime_seconds=30))
+    rc = discover.run(DiscoverArgs(mode="reposts", dry_run=False, max_runtime_seconds=30))
 
     assert rc == discover.TIMEOUT_EXIT_CODE
     assert saved["state"] is not None, "state must be saved on timeout"
@@ -126,7 +126,7 @@ class TestSearchPosts:
             ]
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             results = search_posts(
                 "https://bsky.social", "jwt-token", "test query"
@@ -142,7 +142,7 @@ class TestSearchPosts:
         mock_response = MagicMock()
         mock_response.json.return_value = {"posts": []}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             search_posts(
                 "https://bsky.social", "jwt", "query", 
@@ -157,7 +157,7 @@ class TestSearchPosts:
         mock_response = MagicMock()
         mock_response.json.return_value = {"posts": []}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             search_posts(
                 "https://bsky.social", "jwt", "query",
@@ -172,7 +172,7 @@ class TestSearchPosts:
         mock_response = MagicMock()
         mock_response.json.return_value = {"posts": []}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             search_posts(
                 "https://bsky.social", "jwt", "query",
@@ -187,7 +187,7 @@ class TestSearchPosts:
         mock_response = MagicMock()
         mock_response.json.return_value = {"posts": []}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             search_posts(
                 "https://bsky.social", "jwt", "query",
@@ -242,7 +242,7 @@ class TestSearchErrorHandling:
             "400 Client Error", response=mock_response
         )
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             with pytest.raises(SystemExit, match="Search failed for author"):
                 search_posts(
@@ -261,7 +261,7 @@ class TestSearchErrorHandling:
             "400 Client Error", response=mock_response
         )
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             with pytest.raises(SystemExit, match="Search failed.*bad query"):
                 search_posts("https://bsky.social", "jwt", "query")
@@ -276,7 +276,7 @@ class TestSearchErrorHandling:
             "500 Server Error", response=mock_response
         )
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value = mock_response
             with pytest.raises(real_requests.HTTPError):
                 search_posts("https://bsky.social", "jwt", "query")
@@ -66,3 +66,25 @@ def test_search_history_run_does_not_crash_on_partially_migrated_db(monkeypatch,
 
     assert rc == 0
     assert '"results": []' in out
+
+
+def test_ensure_schema_skips_reconcile_script_when_schema_is_complete():
+    from bsky_cli.storage import db as storage_db
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    storage_db.ensure_schema(conn)
+
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    storage_db.ensure_schema(conn)
+    conn.set_trace_callback(None)
+
+    assert not any("CREATE TABLE IF NOT EXISTS actors" in s for s in statements)
+
+    # Dropping one reconciled object makes the next call heal it again.
+    conn.execute("DROP INDEX idx_dm_members_did")
+    storage_db.ensure_schema(conn)
+    assert conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_dm_members_did'"
+    ).fetchone() is not None
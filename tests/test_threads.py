@@ -108,6 +108,23 @@ class TestTrackedThread:
         assert len(restored.branches) == 1
         assert restored.engaged_interlocutors == ["did:plc:alice"]
 
+    def test_to_dict_covers_every_field(self):
+        """Serialized keys should track the dataclass fields in order."""
+        import dataclasses
+
+        thread = TrackedThread(
+            root_uri="at://r", root_url="https://r", root_author_handle="root",
+            root_author_did="did:plc:root", main_topics=[], root_text="",
+            overall_score=0.0, branches={}, total_our_replies=0,
+            created_at="2026-02-04T10:00:00Z", last_activity_at="2026-02-04T10:00:00Z",
+        )
+        assert list(thread.to_dict()) == [f.name for f in dataclasses.fields(TrackedThread)]
+        assert list(Branch.from_dict({
+            "our_reply_uri": "x", "our_reply_url": "x", "interlocutors": [],
+            "interlocutor_dids": [], "last_activity_at": "", "message_count": 0,
+            "topic_drift": 0.0, "branch_score": 0.0,
+        }).to_dict()) == [f.name for f in dataclasses.fields(Branch)]
+
     def test_defaults(self):
         """Should have sensible defaults."""
         thread = TrackedThread(
@@ -323,6 +340,63 @@ class TestScoreBranch:
         
         assert score_engaged > score_not_engaged
 
+    def test_profile_scores_cache_reused(self, monkeypatch):
+        """Should score each interlocutor profile once per shared cache."""
+        import bsky_cli.threads_mod.scoring as scoring
+
+        calls = []
+        real = scoring.score_interlocutor
+
+        def counting(profile):
+            calls.append(profile.did)
+            return real(profile)
+
+        monkeypatch.setattr(scoring, "score_interlocutor", counting)
+        profiles = {
+            "did:plc:alice": InterlocutorProfile(
+                did="did:plc:alice", handle="alice", display_name="Alice",
+                followers_count=5000, follows_count=500, posts_count=1000
+            )
+        }
+        cache: dict[str, float] = {}
+        for uri in ("a", "b", "c"):
+            branch = Branch(
+                our_reply_uri=uri, our_reply_url=uri,
+                interlocutors=["alice"], interlocutor_dids=["did:plc:alice"],
+                last_activity_at="2026-01-01T00:00:00Z",
+                message_count=2, topic_drift=0.2, branch_score=0
+            )
+            scoring.score_branch(branch, ["AI"], profiles, profile_scores=cache)
+
+        assert calls == ["did:plc:alice"]
+        assert "did:plc:alice" in cache
+
+    def test_now_epoch_controls_recency_bonus(self):
+        """Should measure branch age against the supplied now_epoch."""
+        branch = Branch(
+            our_reply_uri="x", our_reply_url="x",
+            interlocutors=[], interlocutor_dids=[],
+            last_activity_at="2026-01-01T00:00:00Z",
+            message_count=1, topic_drift=0.5, branch_score=0
+        )
+        last = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+        fresh = score_branch(branch, ["AI"], {}, now_epoch=last + 600)
+        stale = score_branch(branch, ["AI"], {}, now_epoch=last + 86400)
+        assert fresh - stale == 10
+
+    def test_naive_last_activity_is_utc(self):
+        """Should read a timestamp without an offset as UTC."""
+        branch = Branch(
+            our_reply_uri="x", our_reply_url="x",
+            interlocutors=[], interlocutor_dids=[],
+            last_activity_at="2026-01-01T00:00:00",
+            message_count=1, topic_drift=0.5, branch_score=0
+        )
+        last = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+        recent = score_branch(branch, ["AI"], {}, now_epoch=last + 3 * 3600)
+        stale = score_branch(branch, ["AI"], {}, now_epoch=last + 86400)
+        assert recent - stale == 5
+
 
 # ============================================================================
 # Utility Tests
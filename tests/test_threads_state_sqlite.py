@@ -126,3 +126,23 @@ def test_tracked_thread_from_dict_missing_root_uri():
     }
     result = TrackedThread.from_dict(legacy_entry)
     assert result is None
+
+
+def test_open_default_db_is_cached_per_process(monkeypatch):
+    from bsky_cli.threads_mod import state as threads_state
+
+    opened = []
+
+    def fake_connect():
+        conn = _mk_conn()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(threads_state, "_conn", None)
+    monkeypatch.setattr(threads_state, "_connect_default_db", fake_connect)
+
+    first = threads_state._open_default_db()
+    second = threads_state._open_default_db()
+
+    assert first is second
+    assert len(opened) == 1